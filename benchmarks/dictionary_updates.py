@@ -0,0 +1,67 @@
+"""
+Перевірка та вимірювання інкрементального оновлення транслятора після змін словника.
+
+Після кожного пакета випадкових змін (зокрема ключів у NFD, що мають синоніми в NFC)
+результат транслятора, що оновлюється інкрементально, порівнюється з результатом
+транслятора, побудованого заново.
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.dictionary_updates [кількість пакетів змін]
+"""
+import asyncio
+import random
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+from source.dictionary import DictionaryManager
+from source.logger import logger
+from source.translate import Translate
+
+DICTIONARY = "iso9_cyrillic-latin.json"
+VALUES = ["X", "Y", "zz", "", "Щ"]
+
+
+def random_key(rng: random.Random, keys: list[str]) -> str:
+    key = ''.join(rng.choices(keys, k=rng.randint(1, 2)))
+    return unicodedata.normalize(rng.choice(('NFC', 'NFD')), key)
+
+
+async def main() -> None:
+    # Вимикаємо журнали, щоб вимірювати саму обробку
+    logger.remove()
+    batches = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    dm = DictionaryManager(Path(__file__).resolve().parent.parent / "dictionaries")
+    await dm.index()
+    dictionary = dm[DICTIONARY]
+    translator = Translate(dictionary)
+    rng = random.Random(0)
+    keys = list(dictionary.get_data()) + ["й", "Й", "ї", "ЙЙ"]
+    sample = ' '.join(rng.choices(keys, k=2000))
+    sample += ' ' + unicodedata.normalize('NFD', sample)
+
+    incremental = rebuild = 0.0
+    for _ in range(batches):
+        for _ in range(rng.randint(1, 4)):
+            key = random_key(rng, keys)
+            if key in dictionary.get_data() and rng.random() < 0.5:
+                del dictionary[key]
+            else:
+                dictionary[key] = rng.choice(VALUES)
+
+        started = time.perf_counter()
+        translator._sync_dictionary()
+        incremental += time.perf_counter() - started
+        started = time.perf_counter()
+        rebuilt = Translate(dictionary)
+        rebuild += time.perf_counter() - started
+        actual, expected = translator.transliterate(sample), rebuilt.transliterate(sample)
+        assert actual == expected, "інкрементальне оновлення розходиться з повною перебудовою"
+
+    print(f"{batches} пакетів змін: інкрементально {incremental * 1000:.1f} мс, перебудова {rebuild * 1000:.1f} мс")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""
+Порівняння однопрохідної транслітерації за кількома словниками (MultiTranslate)
+з окремими викликами Translate.transliterate для кожного словника.
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.multi_transliterate [кількість символів]
+"""
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+from source.dictionary import DictionaryManager
+from source.logger import logger
+from source.translate import MultiTranslate, Translate
+
+DICTIONARIES = [
+    "ukrlat-ukrkyr_variant-1_br.json",
+    "ukrlat-ukrkyr_variant-2_br.json",
+    "ukrlat-ukrkyr_variant-3_br.json",
+    "ukrlat-ukrkyr_variant-4_br.json",
+    "ukrlat-ukrkyr_variant-1+_br.json",
+]
+
+
+def make_corpus(translator: Translate, size: int) -> str:
+    """Генерує текст з ключів словника, пробілів і розділових знаків."""
+    random.seed(0)
+    keys = list(translator.get_dictionary().get_data()) + [" "] * 8 + [", ", ".\n"]
+    parts = []
+    length = 0
+    while length < size:
+        key = random.choice(keys)
+        parts.append(key)
+        length += len(key)
+    return ''.join(parts)
+
+
+def best_of(function, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def main() -> None:
+    # Вимикаємо журнали, щоб вимірювати саму транслітерацію
+    logger.remove()
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    dm = DictionaryManager(Path(__file__).resolve().parent.parent / "dictionaries")
+    await dm.index()
+    dictionaries = [dm[name] for name in DICTIONARIES]
+
+    multi = MultiTranslate(dictionaries)
+    translators = multi.translators
+    text = make_corpus(translators[0], size)
+
+    assert multi.transliterate(text) == [translator.transliterate(text) for translator in translators]
+
+    separate = best_of(lambda: [translator.transliterate(text) for translator in translators])
+    single_pass = best_of(lambda: multi.transliterate(text))
+    print(f"Символів: {len(text)}, словників: {len(translators)}")
+    print(f"Окремі виклики Translate.transliterate: {separate:.3f} с")
+    print(f"MultiTranslate.transliterate:           {single_pass:.3f} с ({separate / single_pass:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Вимірювання нормалізації Unicode для входу у формах NFC, NFD та змішаній,
+а також перевірка, що потокова транслітерація не розрізає комбіновані послідовності.
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.normalization [кількість символів]
+"""
+import asyncio
+import random
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+from source.dictionary import DictionaryManager
+from source.logger import logger
+from source.translate import Translate
+
+DICTIONARY = "iso9_latin-cyrillic.json"
+WORDS = ["Київ", "їжак", "Йосип", "Чорнобиль", "ґанок", "щастя", "ЙОГО", "Čornobilʹ", "Kiïv", "G̀anok", "text"]
+
+
+def make_inputs(size: int) -> dict[str, str]:
+    random.seed(0)
+    words = []
+    length = 0
+    while length < size:
+        word = random.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    nfc = unicodedata.normalize('NFC', ' '.join(words))
+    nfd = unicodedata.normalize('NFD', nfc)
+    mixed = ' '.join(unicodedata.normalize(random.choice(('NFC', 'NFD')), word) for word in nfc.split(' '))
+    cyrillic = ' '.join(word for word in nfc.split(' ') if word.isalpha() and not word.isascii() and "ʹ" not in word and "Č" not in word)
+    return {"ASCII": "a" * len(nfc), "NFC": nfc, "NFC-кир": cyrillic, "NFD": nfd, "mixed": mixed}
+
+
+def best_of(function, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def main() -> None:
+    # Вимикаємо журнали, щоб вимірювати саму обробку
+    logger.remove()
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    dm = DictionaryManager(Path(__file__).resolve().parent.parent / "dictionaries")
+    await dm.index()
+    translator = Translate(dm[DICTIONARY])
+
+    for name, text in make_inputs(size).items():
+        always = best_of(lambda: unicodedata.normalize('NFC', text))
+        checked = best_of(lambda: Translate.normalize(text))
+        copied = Translate.normalize(text) is not text
+        print(f"{name:>7}: unicodedata.normalize {always * 1000:8.2f} мс, Translate.normalize {checked * 1000:8.2f} мс, копія: {copied}")
+
+        sample = text[:20_000]
+        expected = translator.transliterate(sample)
+        for chunk_size in (1, 2, 3, 7, 64):
+            chunks = (sample[i:i + chunk_size] for i in range(0, len(sample), chunk_size))
+            assert ''.join(translator.transliterate_iter(chunks)) == expected, (name, chunk_size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""
+Вимірювання накладних витрат звітування про хід обробки файлу конвеєром.
+
+Порівнюється обробка без звіту, зі структурованими рядками прогресу та зі смугою rich.
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.progress [кількість рядків]
+"""
+import asyncio
+import io
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+
+from source.console_ui import ConsoleUI
+from source.dictionary import DictionaryManager
+from source.internationalization import internationalization
+from source.logger import logger
+from source.pipeline import FilePipeline
+
+DICTIONARY = "iso9_cyrillic-latin.json"
+WORDS = ["Київ", "їжак", "Йосип", "Чорнобиль", "ґанок", "щастя", "ЙОГО", "привіт", "світ", "text"]
+
+
+def make_input(path: Path, lines: int) -> None:
+    random.seed(0)
+    with open(path, "w", encoding="utf-8") as file:
+        for _ in range(lines):
+            file.write(' '.join(random.choices(WORDS, k=8)) + "\n")
+
+
+async def best_of(run, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def main() -> None:
+    # Вимикаємо журнали, щоб вимірювати саму обробку
+    logger.remove()
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    root = Path(__file__).resolve().parent.parent
+    internationalization.path = root / "internationalization"
+    await internationalization.load_localization()
+    dm = DictionaryManager(root / "dictionaries")
+    await dm.index()
+    pipeline = FilePipeline(dm[DICTIONARY])
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = Path(directory) / "input.txt"
+        output_path = Path(directory) / "output.txt"
+        make_input(input_path, lines)
+        total = input_path.stat().st_size
+
+        # Загальний час виміру зашумлений, тож окремо рахуємо час, витрачений у самій функції звіту
+        spent = {"seconds": 0.0, "calls": 0}
+
+        async def run_with(console: Console | None) -> None:
+            if console is None:
+                await pipeline.run(input_path, output_path)
+                return
+            with ConsoleUI(console).display_progress(input_path.name, total) as progress:
+                def measured(done: int, chars: int) -> None:
+                    started = time.perf_counter()
+                    progress(done, chars)
+                    spent["seconds"] += time.perf_counter() - started
+                    spent["calls"] += 1
+
+                await pipeline.run(input_path, output_path, measured)
+
+        baseline = await best_of(lambda: run_with(None))
+        print(f"{'без звіту':>16}: {baseline:8.3f} с, {total / baseline / 1_000_000:6.2f} MB/s")
+        for name, console in (("рядки прогресу", Console(file=io.StringIO())),
+                              ("смуга rich", Console(file=io.StringIO(), force_terminal=True))):
+            spent.update(seconds=0.0, calls=0)
+            elapsed = await best_of(lambda: run_with(console))
+            print(f"{name:>16}: {elapsed:8.3f} с, {total / elapsed / 1_000_000:6.2f} MB/s, "
+                  f"різниця {(elapsed / baseline - 1) * 100:+.2f}%, у функції звіту {spent['seconds'] * 1000:.2f} мс "
+                  f"за {spent['calls']} викликів ({spent['seconds'] * 1000 / max(spent['calls'], 1):.3f} мс на виклик)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,12 +3,18 @@
 """
 import asyncio
 import argparse
+import contextlib
 from pathlib import Path
 
 import aiofiles
 
 from source.dictionary import Dictionary, DictionaryManager
-from source.translate import Translate
+from source.translate import Translate, MultiTranslate
+from source.detection import DictionaryDetector
+from source.records import RecordTransliterator, RecordsStats
+from source.roundtrip import discover_pairs, run_roundtrip
+from source.pipeline import FilePipeline, PipelineStats
+from source.progress import ProgressTicker
 from source.internationalization import internationalization, i18n
 from source.console_ui import cui
 from source.command_line_handler import parse_command_line_arguments
@@ -46,6 +52,13 @@ async def interactive_mode(dm: DictionaryManager, selected_text: str | None = No
                 cui.display_message(i18n["transliteration_exiting"])
                 break
             cui.display_message(i18n["transliteration_result"].format(translator.transliterate(text)))
+    elif len(selected_text) > settings.console_stream_threshold:
+        # Великий результат виводиться потоково, без розбору розмітки rich
+        chunk_size: int = settings.console_stream_chunk_size
+        cui.display_message(i18n["transliteration_result"].format(""))
+        cui.display_stream(translator.transliterate_iter(
+            selected_text[i:i + chunk_size] for i in range(0, len(selected_text), chunk_size)
+        ))
     else:
         cui.display_message(
             i18n["transliteration_result"].format(
@@ -55,15 +68,95 @@ async def interactive_mode(dm: DictionaryManager, selected_text: str | None = No
     return None
 
 
-async def files_mode(dm: DictionaryManager, dictionary_name: str, input_path: Path, output_path: Path):
-    # Створюємо транслятор ОДИН РАЗ
-    translator = Translate(dm[dictionary_name])
+async def files_mode(dm: DictionaryManager, dictionary_name: str, input_path: Path, output_path: Path,
+                     use_manifest: bool = False) -> PipelineStats:
+    """
+    Режим транслітерації файлу.
+
+    Читання, транслітерація блоків рядків і запис виконуються конвеєром паралельно.
+    """
+    dictionary: Dictionary = dm[dictionary_name]
+    pipeline = FilePipeline(dictionary, use_manifest)
+    if not settings.is_show_progress:
+        return await pipeline.run(input_path, output_path)
+    with cui.display_progress(input_path.name, input_path.stat().st_size) as progress:
+        return await pipeline.run(input_path, output_path, progress)
+
+async def multi_files_mode(dm: DictionaryManager, dictionary_names: list[str], input_path: Path, output_path: Path) -> None:
+    """
+    Режим транслітерації файлу одразу за кількома словниками за один прохід.
+    Результат для кожного словника записується у файл <назва>.<id словника><розширення>.
+    """
+    translator = MultiTranslate([dm[dictionary_name] for dictionary_name in dictionary_names])
+    output_paths: list[Path] = [
+        output_path.with_name(f"{output_path.stem}.{dictionary.get_dictionary().info.id}{output_path.suffix}")
+        for dictionary in (t.get_dictionary() for t in translator.translators)
+    ]
+
+    chars_written = 0
 
-    async with (aiofiles.open(str(input_path), mode="r", encoding="utf-8") as infile,
-                aiofiles.open(str(output_path), mode="w", encoding="utf-8") as outfile,):
+    async with contextlib.AsyncExitStack() as stack:
+        infile = await stack.enter_async_context(aiofiles.open(str(input_path), mode="r", encoding="utf-8"))
+        outfiles = [
+            await stack.enter_async_context(aiofiles.open(str(path), mode="w", encoding="utf-8"))
+            for path in output_paths
+        ]
+        if settings.is_show_progress:
+            progress = stack.enter_context(cui.display_progress(input_path.name, input_path.stat().st_size))
+            await stack.enter_async_context(
+                # Позиція у файлі, а не розмір декодованого тексту, тож кінці рядків CRLF теж враховуються
+                ProgressTicker(lambda: progress(infile.buffer.tell(), chars_written), settings.progress_interval)
+            )
         async for line in infile:
-            processed_line: str = translator.transliterate(line)
-            await outfile.write(processed_line)
+            for outfile, processed_line in zip(outfiles, translator.transliterate(line)):
+                chars_written += len(processed_line)
+                await outfile.write(processed_line)
+
+async def records_mode(dm: DictionaryManager, dictionary_name: str, input_path: Path, output_path: Path,
+                       fields: list[str], record_format: str) -> None:
+    """
+    Режим транслітерації вибраних полів у файлах CSV або JSONL.
+    """
+    translator = Translate(dm[dictionary_name])
+    rt = RecordTransliterator(translator, fields, record_format, settings.records_cache_size)
+    try:
+        if settings.is_show_progress:
+            with cui.display_progress(input_path.name, input_path.stat().st_size) as progress:
+                stats: RecordsStats = await rt.process(input_path, output_path, progress)
+        else:
+            stats: RecordsStats = await rt.process(input_path, output_path)
+    except KeyError as error:
+        logger.error(f"Поля {fields} не знайдено у файлі {input_path}: {error}")
+        cui.display_message(i18n["record_fields_not_found"].format(", ".join(fields)))
+        return None
+    cui.display_message(
+        i18n["records_stats"].format(stats.records, stats.records_per_second, stats.fields, stats.cache_hits, stats.skipped)
+    )
+    return None
+
+async def detect_dictionary(dm: DictionaryManager, sample: str, to_language: str | None = None) -> str | None:
+    """
+    Автоматично визначає словник за зразком тексту.
+
+    :return: Назва файлу знайденого словника або None.
+    """
+    dictionary: Dictionary | None = DictionaryDetector(dm).detect(sample[:settings.detection_sample_size], to_language)
+    if dictionary is None:
+        logger.error("Не вдалося автоматично визначити словник.")
+        cui.display_message(i18n["dictionary_auto_not_detected"])
+        return None
+    cui.display_message(i18n["dictionary_auto_detected"].format(dictionary.dictionary.info.name))
+    return dictionary.get_dictionary().info.file_name
+
+async def detect_file_dictionary(dm: DictionaryManager, input_path: Path, to_language: str | None = None) -> str | None:
+    """
+    Автоматично визначає словник за початком файлу.
+
+    :return: Назва файлу знайденого словника або None.
+    """
+    async with aiofiles.open(input_path, mode='r', encoding='utf-8') as file:
+        sample = await file.read(settings.detection_sample_size)
+    return await detect_dictionary(dm, sample, to_language)
 
 async def main() -> None:
     """
@@ -142,6 +235,29 @@ async def main() -> None:
         else:
             cui.display_dictionary_list(dm)
 
+    elif args.roundtrip:
+        if args.dictionary and args.dictionary not in dm.get_list_dictionaries():
+            logger.error(f"Словник {args.dictionary} не знайдено.")
+            cui.display_message(i18n["dictionary_not_found"].format(args.dictionary))
+            return None
+        corpus: Path | None = Path(args.input) if args.input else None
+        if corpus is not None and not corpus.exists():
+            logger.error(f"Файл {corpus} не знайдено.")
+            cui.display_message(i18n["input_file_not_found"].format(corpus))
+            return None
+        pairs, ambiguous = discover_pairs(dm, args.dictionary)
+        for forward_name, candidates in ambiguous.items():
+            cui.display_message(i18n["roundtrip_ambiguous"].format(forward_name, ", ".join(candidates)))
+        if not pairs:
+            cui.display_message(i18n["roundtrip_no_pairs"])
+            return None
+        logger.debug(f"Перевірка зворотної транслітерації для {len(pairs)} пар словників, корпус: {corpus}")
+        reports, elapsed = await run_roundtrip(
+            pairs, corpus, settings.roundtrip_lines, settings.roundtrip_batch_size,
+            settings.roundtrip_workers, args.ignore_case
+        )
+        cui.display_roundtrip_reports(reports, elapsed)
+
     elif (args.dictionary or args.text or args.input) and not args.output:
         if args.input:
             input_path: Path = Path(args.input)
@@ -153,7 +269,54 @@ async def main() -> None:
                 text = await file.read()
         else:
             text = args.text
-        await interactive_mode(dm, text, args.dictionary)
+        dictionary_name: str | None = args.dictionary
+        if dictionary_name == "auto":
+            dictionary_name = await detect_dictionary(dm, text, args.to_language) if text else None
+            if dictionary_name is None and text:
+                return None
+        await interactive_mode(dm, text, dictionary_name)
+
+    elif args.input and args.output and args.multi_dictionary:
+        input_path: Path = Path(args.input)
+        output_path: Path = Path(args.output)
+        if not input_path.exists():
+            logger.error(f"Файл {input_path} не знайдено.")
+            cui.display_message(i18n["input_file_not_found"].format(input_path))
+            return None
+        for dictionary_name in args.multi_dictionary:
+            if dictionary_name not in dm.get_list_dictionaries():
+                logger.error(f"Словник {dictionary_name} не знайдено.")
+                cui.display_message(i18n["dictionary_not_found"].format(dictionary_name))
+                return None
+        logger.debug(
+            f"Виконання транслітерації з файлу {input_path} за словниками {args.multi_dictionary} у файли за зразком {output_path}"
+        )
+        await multi_files_mode(dm, args.multi_dictionary, input_path, output_path)
+
+    elif args.input and args.output and args.dictionary and args.fields:
+        input_path: Path = Path(args.input)
+        output_path: Path = Path(args.output)
+        if not input_path.exists():
+            logger.error(f"Файл {input_path} не знайдено.")
+            cui.display_message(i18n["input_file_not_found"].format(input_path))
+            return None
+        if args.dictionary == "auto":
+            args.dictionary = await detect_file_dictionary(dm, input_path, args.to_language)
+            if args.dictionary is None:
+                return None
+        if args.dictionary not in dm.get_list_dictionaries():
+            logger.error(f"Словник {args.dictionary} не знайдено.")
+            cui.display_message(i18n["dictionary_not_found"].format(args.dictionary))
+            return None
+        record_format: str | None = args.record_format or RecordTransliterator.detect_format(input_path)
+        if record_format is None:
+            logger.error(f"Не вдалося визначити формат записів файлу {input_path}.")
+            cui.display_message(i18n["record_format_unknown"].format(input_path))
+            return None
+        logger.debug(
+            f"Виконання транслітерації полів {args.fields} записів {record_format} з файлу {input_path} за словником {args.dictionary} у файл {output_path}"
+        )
+        await records_mode(dm, args.dictionary, input_path, output_path, args.fields, record_format)
 
     elif args.input and args.output and args.dictionary:
         input_path: Path = Path(args.input)
@@ -162,6 +325,10 @@ async def main() -> None:
             logger.error(f"Файл {input_path} не знайдено.")
             cui.display_message(i18n["input_file_not_found"].format(input_path))
             return None
+        if args.dictionary == "auto":
+            args.dictionary = await detect_file_dictionary(dm, input_path, args.to_language)
+            if args.dictionary is None:
+                return None
         if args.dictionary not in dm.get_list_dictionaries():
             logger.error(f"Словник {args.dictionary} не знайдено.")
             cui.display_message(i18n["dictionary_not_found"].format(args.dictionary))
@@ -169,7 +336,17 @@ async def main() -> None:
         logger.debug(
             f"Виконання транслітерації з файлу {input_path} за словником {args.dictionary} у файл {output_path}"
         )
-        await files_mode(dm, args.dictionary, input_path, output_path)
+        stats: PipelineStats = await files_mode(dm, args.dictionary, input_path, output_path, args.manifest)
+        if args.manifest:
+            if stats.skipped_file:
+                cui.display_message(i18n["manifest_file_skipped"].format(input_path))
+            cui.display_message(i18n["manifest_stats"].format(stats.reused_bytes, stats.recomputed_bytes))
+        if args.stats:
+            cui.display_message(i18n["pipeline_stats"].format(
+                stats.blocks, stats.elapsed,
+                stats.reader_utilisation, stats.transform_utilisation, stats.writer_utilisation,
+                stats.read_queue_max, stats.read_queue_average, stats.write_queue_max, stats.write_queue_average,
+            ))
 
     else:
         await interactive_mode(dm)
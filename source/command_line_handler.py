@@ -17,9 +17,18 @@ async def add_parser_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("-h", "--help", action="help", help=i18n["--help_help"])
 
     parser.add_argument("-d", "--dictionary", required=False, type=str, help=i18n["--dictionary_help"])
+    parser.add_argument("-md", "--multi_dictionary", required=False, nargs="+", type=str, help=i18n["--multi_dictionary_help"])
     parser.add_argument("-t", "--text", required=False, type=str, help=i18n["--text_help"])
     parser.add_argument("-i", "--input", required=False, type=Path, help=i18n["--input_help"])
     parser.add_argument("-o", "--output", required=False, type=Path, help=i18n["--output_help"])
+    parser.add_argument("-tl", "--to_language", required=False, type=str, help=i18n["--to_language_help"])
+    parser.add_argument("-f", "--fields", required=False, nargs="+", type=str, help=i18n["--fields_help"])
+    parser.add_argument("-rf", "--record_format", required=False, choices=["csv", "jsonl"], help=i18n["--record_format_help"])
+
+    parser.add_argument("-m", "--manifest", required=False, action="store_true", help=i18n["--manifest_help"])
+    parser.add_argument("-s", "--stats", required=False, action="store_true", help=i18n["--stats_help"])
+    parser.add_argument("-rt", "--roundtrip", required=False, action="store_true", help=i18n["--roundtrip_help"])
+    parser.add_argument("-ic", "--ignore_case", required=False, action="store_true", help=i18n["--ignore_case_help"])
 
     parser.add_argument("-v", "--version", required=False, action="store_true", help=i18n["--version_help"])
     parser.add_argument("-a", "--author", required=False, action="store_true", help= i18n["--author_help"])
@@ -29,6 +29,24 @@ class Settings(pydantic_settings.BaseSettings):
     language: str = "ukr"
     version: str = "1.0.0"
 
+    detection_sample_size: int = 65536
+    records_cache_size: int = 65536
+    console_stream_threshold: int = 65536
+    console_stream_chunk_size: int = 16384
+
+    files_block_lines: int = 1024
+    pipeline_executor: str = "thread"
+    pipeline_workers: int | None = None
+    pipeline_queue_size: int = 8
+
+    is_show_progress: bool = True
+    progress_interval: float = 0.5
+    progress_log_interval: float = 10.0
+
+    roundtrip_lines: int = 20000
+    roundtrip_batch_size: int = 500
+    roundtrip_workers: int | None = None
+
     is_log: bool = True
     is_show_log: bool = False
     LOG_FORMAT: str = "<y>IDP:{process}</y> <ly>SPT:{elapsed}</ly> | <g>{time:YYYY-MM-DD}</g> <lg>{time:HH:mm:ss}</lg> | <level>{level}</level> | <m>F:{file}</m> <lm>L:{line} FU:{function}</lm> | {message}"
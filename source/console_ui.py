@@ -1,14 +1,22 @@
 """
 Інтерфейс користувача для консолі.
 """
+import contextlib
+import time
+from collections.abc import Iterable, Iterator
 
 from rich.console import Console
+from rich.progress import (Progress, TextColumn, BarColumn, DownloadColumn, TransferSpeedColumn,
+                           TimeRemainingColumn)
 from rich.table import Table
 from rich.text import Text
 from rich.panel import Panel
 
 from source.dictionary import DictionaryManager, Dictionary
 from source.internationalization import i18n
+from source.roundtrip import RoundTripReport
+from source.progress import ProgressCallback
+from source.config import settings
 
 
 class ConsoleUI:
@@ -16,6 +24,10 @@ class ConsoleUI:
     Клас для взаємодії з користувачем через консоль.
     """
     console: Console
+    # Рядки прогресу без терміналу читаються програмами, тож їхній формат не перекладається
+    progress_line_format: str = (
+        "progress file={} done_bytes={} total_bytes={} percent={:.1f} speed_mb_s={:.2f} eta_s={:.0f} chars={}"
+    )
 
     def __init__(self, console: Console | None = None) -> None:
         if console is not None:
@@ -31,6 +43,81 @@ class ConsoleUI:
         """
         self.console.print(message)
 
+    def display_stream(self, chunks: Iterable[str]) -> None:
+        """
+        Виводить великий текст частинами напряму у файл консолі.
+
+        Розмітка, підсвічування та перенесення rich не застосовуються, тож перша частина
+        з'являється одразу, а час виводу лінійний від розміру тексту.
+
+        :param chunks: Частини тексту для відображення.
+        """
+        file = self.console.file
+        for chunk in chunks:
+            file.write(chunk)
+            file.flush()
+        file.write("\n")
+        file.flush()
+
+    @contextlib.contextmanager
+    def display_progress(self, name: str, total: int) -> Iterator[ProgressCallback]:
+        """
+        Відображає хід обробки файлу.
+
+        У терміналі показується смуга прогресу rich зі швидкістю та часом до завершення,
+        інакше періодично виводяться структуровані рядки прогресу. Повертається функція
+        оновлення, яку обробка викликає за таймером.
+
+        :param name: Назва оброблюваного файлу.
+        :param total: Розмір вхідного файлу в байтах.
+        """
+        if self.console.is_terminal:
+            progress = Progress(
+                TextColumn("[cyan]{task.description}"),
+                BarColumn(),
+                DownloadColumn(),
+                TransferSpeedColumn(),
+                TimeRemainingColumn(),
+                TextColumn(i18n["progress_chars"]),
+                console=self.console,
+                auto_refresh=False,
+            )
+            with progress:
+                task = progress.add_task(name, total=total, chars=0)
+
+                def update(done: int, chars: int) -> None:
+                    progress.update(task, completed=done, chars=chars)
+                    progress.refresh()
+
+                yield update
+            return
+
+        started = time.perf_counter()
+        printed = started
+        last: tuple[int, int] = (0, 0)
+
+        def print_line(done: int, chars: int) -> None:
+            elapsed = time.perf_counter() - started
+            speed = done / elapsed if elapsed else 0.0
+            eta = max(total - done, 0) / speed if speed else 0.0
+            self.console.print(
+                self.progress_line_format.format(name, done, total, min(done * 100 / total, 100.0) if total else 100.0,
+                                                 speed / 1_000_000, eta, chars),
+                markup=False, highlight=False, soft_wrap=True,
+            )
+
+        def update(done: int, chars: int) -> None:
+            nonlocal printed, last
+            last = (done, chars)
+            now = time.perf_counter()
+            if now - printed >= settings.progress_log_interval:
+                printed = now
+                print_line(done, chars)
+
+        yield update
+        # Підсумковий рядок виводиться завжди, навіть якщо обробка тривала менше за інтервал
+        print_line(*last)
+
     def get_input(self, prompt: str | Text) -> str:
         """
         Отримує вхідні дані від користувача.
@@ -106,5 +193,38 @@ class ConsoleUI:
             )
         self.console.print(table)
 
+    def display_roundtrip_reports(self, reports: list[RoundTripReport], elapsed: float) -> None:
+        """
+        Відображає звіти перевірки зворотної транслітерації.
+
+        :param reports: Звіти для кожної пари словників.
+        :param elapsed: Загальний час перевірки в секундах.
+        """
+        table = Table(title=Text(i18n["roundtrip_title"], justify="left"))
+        table.add_column(i18n["roundtrip_forward"], style="cyan", no_wrap=True)
+        table.add_column(i18n["roundtrip_inverse"], style="cyan", no_wrap=True)
+        table.add_column(i18n["roundtrip_lines"], style="green", justify="right")
+        table.add_column(i18n["roundtrip_mismatches"], style="red", justify="right")
+        table.add_column(i18n["roundtrip_rules"], style="yellow", max_width=30)
+        table.add_column(i18n["roundtrip_example"], style="blue", max_width=40)
+        table.add_column(i18n["roundtrip_throughput"], style="green", justify="right")
+
+        for report in reports:
+            rules = ", ".join(f"{rule}×{count}" for rule, count in list(report.rules.items())[:5])
+            example = " → ".join(report.examples[0]) if report.examples else ""
+            table.add_row(
+                report.forward,
+                report.inverse,
+                str(report.lines),
+                f"{report.mismatches} ({report.mismatch_rate:.1%})",
+                Text(rules or i18n["no_data"]),
+                Text(example or i18n["no_data"]),
+                f"{report.chars_per_second:,.0f}",
+            )
+        self.console.print(table)
+
+        chars = sum(report.chars for report in reports)
+        self.display_message(i18n["roundtrip_total"].format(len(reports), elapsed, chars / elapsed if elapsed else 0.0))
+
 cui: ConsoleUI = ConsoleUI()
 
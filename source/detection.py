@@ -0,0 +1,96 @@
+"""
+Файл для автоматичного визначення словника за зразком вхідного тексту.
+"""
+import math
+import unicodedata
+from collections import Counter
+
+from source.dictionary import Dictionary, DictionaryManager
+from source.logger import logger
+
+
+class DictionaryDetector:
+    """
+    Клас для визначення вхідного словника за частотним підписом символів.
+
+    Підпис словника — гістограма символів його ключів. Зразок тексту зводиться
+    до такої ж гістограми, тож вартість оцінки залежить лише від розміру алфавіту.
+    """
+
+    dm: DictionaryManager
+    _signatures: dict[str, Counter]
+
+    def __init__(self, dm: DictionaryManager) -> None:
+        if not isinstance(dm, DictionaryManager):
+            logger.error("[DictionaryDetector] Об'єкт dm має бути типу DictionaryManager")
+            raise TypeError("DM must be a DictionaryManager object")
+        self.dm = dm
+        self._signatures = {}
+        self.build_signatures()
+
+    @staticmethod
+    def _is_script_char(char: str) -> bool:
+        """Чи несе символ інформацію про писемність (літери та комбіновані діакритики)."""
+        return char.isalpha() or unicodedata.combining(char) != 0
+
+    def build_signatures(self) -> dict[str, Counter]:
+        """Попередньо обчислює підписи для всіх завантажених словників."""
+        self._signatures = {}
+        dictionaries = self.dm.get_list_dictionaries() or {}
+        for name, dictionary in dictionaries.items():
+            data = dictionary.get_data()
+            if not data:
+                continue
+            signature = Counter()
+            for key in data:
+                signature.update(char for char in unicodedata.normalize('NFC', key).lower() if self._is_script_char(char))
+            self._signatures[name] = signature
+        logger.debug(f"[DictionaryDetector] Обчислено підписи для {len(self._signatures)} словників")
+        return self._signatures
+
+    @staticmethod
+    def _score(histogram: Counter, signature: Counter) -> tuple[float, float]:
+        """
+        Оцінює відповідність гістограми зразка підпису словника.
+
+        :return: Частка символів зразка, покритих ключами словника, та косинусна подібність гістограм.
+        """
+        total = sum(histogram.values())
+        covered = sum(count for char, count in histogram.items() if char in signature)
+        dot = sum(count * signature[char] for char, count in histogram.items() if char in signature)
+        norm = math.sqrt(sum(count * count for count in histogram.values())) * math.sqrt(sum(count * count for count in signature.values()))
+        return covered / total, (dot / norm if norm else 0.0)
+
+    def detect(self, sample: str, to_language: str | None = None) -> Dictionary | None:
+        """
+        Визначає словник, вхідна мова якого найкраще відповідає зразку тексту.
+
+        :param sample: Зразок вхідного тексту (зазвичай перші кілобайти файлу).
+        :param to_language: Якщо вказано, розглядаються лише словники з такою вихідною мовою.
+        :return: Знайдений словник або None.
+        """
+        if not isinstance(sample, str):
+            logger.error("[DictionaryDetector] Зразок тексту має бути рядком")
+            raise TypeError("Sample must be a string")
+
+        histogram = Counter(unicodedata.normalize('NFC', sample).lower())
+        histogram = Counter({char: count for char, count in histogram.items() if self._is_script_char(char)})
+        if not histogram:
+            logger.warning("[DictionaryDetector] Зразок не містить літер, визначити словник неможливо.")
+            return None
+
+        best_name, best_score = None, (0.0, 0.0)
+        for name, signature in self._signatures.items():
+            info = self.dm[name].get_dictionary().info
+            if to_language and info.to_language.lower() != to_language.lower():
+                continue
+            score = self._score(histogram, signature)
+            logger.debug(f"[DictionaryDetector] Оцінка словника {name}: покриття {score[0]:.3f}, подібність {score[1]:.3f}")
+            if score > best_score:
+                best_name, best_score = name, score
+
+        if best_name is None:
+            logger.warning("[DictionaryDetector] Жоден словник не відповідає зразку.")
+            return None
+        logger.info(f"[DictionaryDetector] Визначено словник {best_name} з покриттям {best_score[0]:.3f}")
+        return self.dm[best_name]
@@ -1,7 +1,9 @@
 """
 Файл по роботи зі словниками.
 """
+import hashlib
 import json
+from collections import deque
 from pathlib import Path
 
 import aiofiles
@@ -97,11 +99,20 @@ class IODictionary:
         return dictionary
 
 class Dictionary:
-    """Клас для роботи зі словниками."""
+    """
+    Клас для роботи зі словниками.
+
+    Кожна зміна даних збільшує версію словника, а зміни окремих правил записуються
+    в обмежений журнал, щоб транслятори могли оновлюватися інкрементально.
+    """
 
     file: Path
     dictionary: DictionaryModel | None
     iod: IODictionary
+    version: int
+    changes_limit: int = 1024
+    _changes: deque[tuple[int, str, str | None]]
+    _changes_start: int
 
     def __init__(self, file: Path | str, iod: IODictionary | None = None) -> None:
         if isinstance(file, str):
@@ -112,6 +123,9 @@ class Dictionary:
         self.dictionary = None
         self.file = file
         self.iod = iod if iod else IODictionary()
+        self.version = 0
+        self._changes = deque(maxlen=self.changes_limit)
+        self._changes_start = 0
 
 
     def __getitem__(self, key: str) -> str:
@@ -131,6 +145,7 @@ class Dictionary:
             logger.error("[Dictionary] Ключ і значення мають бути типу str або dict (тільки для значень словника)")
             raise TypeError("Key and value must be strings")
         self.dictionary.data.__setitem__(key, value)
+        self._record_change(key, value)
 
     def __delitem__(self, key: str) -> None:
         if self.dictionary is None:
@@ -140,6 +155,38 @@ class Dictionary:
             logger.error("[Dictionary] Ключ має бути типу str")
             raise TypeError("Key must be a string")
         self.dictionary.data.__delitem__(key)
+        self._record_change(key, None)
+
+    def _record_change(self, key: str | None, value: str | None = None) -> None:
+        """
+        Збільшує версію словника та записує зміну правила в журнал.
+
+        :param key: Змінений ключ або None, якщо дані замінено повністю (журнал скидається).
+        :param value: Нове значення або None, якщо ключ видалено.
+        """
+        self.version += 1
+        if key is None:
+            self._changes.clear()
+            self._changes_start = self.version
+            return
+        if len(self._changes) == self._changes.maxlen:
+            # Найстаріша зміна витісняється з журналу, тож він більше не покриває її версію
+            self._changes_start = self._changes[0][0]
+        self._changes.append((self.version, key, value))
+
+    def get_version(self) -> int:
+        return self.version
+
+    def get_changes(self, since: int) -> list[tuple[str, str | None]] | None:
+        """
+        Повертає зміни правил після версії since у порядку їх внесення.
+
+        :return: Пари (ключ, нове значення або None для видалення) або None,
+            якщо журнал уже не покриває цю версію і потрібне повне перебудування.
+        """
+        if since < self._changes_start:
+            return None
+        return [(key, value) for version, key, value in self._changes if version > since]
 
     def get_file(self) -> Path:
         return self.file
@@ -158,8 +205,9 @@ class Dictionary:
         if not isinstance(dictionary, DictionaryModel):
             logger.error("[Dictionary] Об'єкт dictionary має бути типу DictionaryModel")
             raise TypeError("Dictionary must be a DictionaryModel object")
-        logger.debug(f"[Dictionary] Значення dictionary встановлено: {dictionary.info.name}, було {self.dictionary.info.name}")
+        logger.debug(f"[Dictionary] Значення dictionary встановлено: {dictionary.info.name}, було {self.dictionary.info.name if self.dictionary else None}")
         self.dictionary = dictionary
+        self._record_change(None)
 
     def get_iod(self) -> IODictionary:
         return self.iod
@@ -177,9 +225,15 @@ class Dictionary:
             return None
         return self.dictionary.data
 
+    def get_content_hash(self) -> str:
+        """Повертає хеш даних словника (з урахуванням порядку правил, бо він впливає на пріоритет)."""
+        data = self.get_data() or {}
+        return hashlib.sha256(json.dumps(data, ensure_ascii=False).encode("utf-8")).hexdigest()
+
     async def load(self) -> bool:
         try:
             self.dictionary = await self.iod.read_dictionary(self.file)
+            self._record_change(None)
             if not self.dictionary.data:
                 logger.warning(f"[Dictionary] Словник {self.file.name} не містить даних.")
                 self.dictionary.data = {}
@@ -0,0 +1,149 @@
+"""
+Файл для роботи з маніфестом повторної обробки файлів.
+
+Маніфест зберігає хеші вхідних файлів і їхніх блоків разом з хешем і версією словника,
+щоб під час повторного запуску пропускати незмінені файли або повторно використовувати
+результати незмінених блоків.
+"""
+import hashlib
+import zlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import aiofiles
+import pydantic
+
+from source.config import settings
+from source.dictionary import Dictionary
+from source.logger import logger
+
+
+class ManifestModel(pydantic.BaseModel):
+    """Модель маніфесту."""
+    class EntryModel(pydantic.BaseModel):
+        class BlockModel(pydantic.BaseModel):
+            hash: str
+            output_offset: int
+            output_length: int
+
+        input_hash: str
+        dictionary_hash: str
+        dictionary_version: str
+        output_size: int
+        blocks: list[BlockModel] = []
+
+    entries: dict[str, EntryModel] = {}
+    model_version: str = "1.0.0"
+
+
+class ReuseStats(pydantic.BaseModel):
+    """Модель статистики повторного використання результатів."""
+    reused_bytes: int = 0
+    recomputed_bytes: int = 0
+    skipped_file: bool = False
+
+
+async def read_blocks(infile, block_lines: int, chunk_size: int = 1 << 20,
+                      max_lines: int | None = None, max_chars: int = 1 << 22) -> AsyncIterator[list[str]]:
+    """
+    Читає текстовий файл блоками цілих рядків.
+
+    Блок закінчується після рядка, контрольна сума якого ділиться на block_lines, тож межі
+    блоків залежать лише від вмісту: вставка на початку файлу не зсуває межі наступних блоків.
+    Якщо така межа довго не трапляється (наприклад, у файлі з однакових рядків), блок
+    примусово закінчується після max_lines рядків або max_chars символів, тож розмір блоку обмежений.
+
+    :param block_lines: Середня кількість рядків у блоці.
+    :param max_lines: Найбільша кількість рядків у блоці, за замовчуванням 4 * block_lines.
+    :param max_chars: Кількість символів, після якої блок закінчується на найближчому кінці рядка.
+    """
+    max_lines = max_lines or 4 * block_lines
+    block: list[str] = []
+    block_chars = 0
+    pending = ""
+    while chunk := await infile.read(chunk_size):
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            line += "\n"
+            block.append(line)
+            block_chars += len(line)
+            if (zlib.crc32(line.encode("utf-8")) % block_lines == 0
+                    or len(block) >= max_lines or block_chars >= max_chars):
+                yield block
+                block = []
+                block_chars = 0
+    if pending:
+        block.append(pending)
+    if block:
+        yield block
+
+
+class Manifest:
+    """Клас для роботи з маніфестом повторної обробки."""
+
+    path: Path = settings.PATH_TEMP / "manifest.json"
+    manifest: ManifestModel
+
+    def __init__(self, path: Path | None = None) -> None:
+        if path:
+            if not isinstance(path, Path):
+                logger.error("[Manifest] Об'єкт path має бути типу Path")
+                raise TypeError("Path must be a Path object")
+            self.path = path
+        self.manifest = ManifestModel()
+        logger.debug(f"[Manifest] Ініціалізація Manifest з шляхом: {self.path}")
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    async def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+        """Обчислює хеш вмісту файлу, читаючи його частинами."""
+        digest = hashlib.blake2b(digest_size=16)
+        async with aiofiles.open(path, "rb") as f:
+            while chunk := await f.read(chunk_size):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def entry_key(input_path: Path, output_path: Path) -> str:
+        return f"{input_path.resolve()}|{output_path.resolve()}"
+
+    async def load(self) -> ManifestModel:
+        try:
+            async with aiofiles.open(self.path, "r", encoding="utf-8") as f:
+                self.manifest = ManifestModel.model_validate_json(await f.read())
+            logger.debug(f"[Manifest] Маніфест завантажено з файлу: {self.path}, записів: {len(self.manifest.entries)}")
+        except FileNotFoundError:
+            logger.info(f"[Manifest] Маніфест {self.path} не знайдено, створюється новий.")
+            self.manifest = ManifestModel()
+        except pydantic.ValidationError as e:
+            logger.error(f"[Manifest] Маніфест {self.path} пошкоджено, створюється новий. Детальніше: {e}")
+            self.manifest = ManifestModel()
+        return self.manifest
+
+    async def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(self.path, "w", encoding="utf-8") as f:
+            await f.write(self.manifest.model_dump_json(indent=4))
+        logger.debug(f"[Manifest] Маніфест збережено у файл: {self.path}")
+
+    def get_entry(self, input_path: Path, output_path: Path, dictionary: Dictionary) -> ManifestModel.EntryModel | None:
+        """
+        Повертає запис для пари файлів, якщо він створений тим самим словником.
+
+        Якщо змінився вміст або версія словника, результати повторно використати не можна.
+        """
+        entry = self.manifest.entries.get(self.entry_key(input_path, output_path))
+        if entry is None:
+            return None
+        if (entry.dictionary_hash != dictionary.get_content_hash()
+                or entry.dictionary_version != dictionary.get_dictionary().info.version):
+            logger.info(f"[Manifest] Словник змінився з часу попередньої обробки {input_path}, запис не використовується.")
+            return None
+        return entry
+
+    def set_entry(self, input_path: Path, output_path: Path, entry: ManifestModel.EntryModel) -> None:
+        self.manifest.entries[self.entry_key(input_path, output_path)] = entry
@@ -0,0 +1,251 @@
+"""
+Файл з конвеєром обробки файлів: читання → транслітерація → запис.
+"""
+import asyncio
+import contextlib
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import aiofiles
+
+from source.config import settings
+from source.dictionary import Dictionary
+from source.manifest import Manifest, ManifestModel, ReuseStats, read_blocks
+from source.workers import dictionary_key, init_process_worker, transliterate_lines
+from source.progress import ProgressCallback, ProgressTicker
+from source.logger import logger
+
+
+class PipelineStats(ReuseStats):
+    """Модель статистики конвеєра."""
+    blocks: int = 0
+    bytes_read: int = 0
+    chars_written: int = 0
+    executor: str = "thread"
+    workers: int = 0
+    elapsed: float = 0.0
+    reader_busy: float = 0.0
+    transform_busy: float = 0.0
+    writer_busy: float = 0.0
+    read_queue_max: int = 0
+    read_queue_total: int = 0
+    write_queue_max: int = 0
+    write_queue_total: int = 0
+
+    def _share(self, busy: float, workers: int = 1) -> float:
+        return busy / (self.elapsed * workers) if self.elapsed else 0.0
+
+    @property
+    def reader_utilisation(self) -> float:
+        return self._share(self.reader_busy)
+
+    @property
+    def transform_utilisation(self) -> float:
+        # Потоки транслітерують почергово через GIL, тож одночасно зайнятий щонайбільше один
+        return self._share(self.transform_busy, max(self.workers, 1) if self.executor == "process" else 1)
+
+    @property
+    def writer_utilisation(self) -> float:
+        return self._share(self.writer_busy)
+
+    @property
+    def read_queue_average(self) -> float:
+        return self.read_queue_total / self.blocks if self.blocks else 0.0
+
+    @property
+    def write_queue_average(self) -> float:
+        return self.write_queue_total / self.blocks if self.blocks else 0.0
+
+
+class FilePipeline:
+    """
+    Клас конвеєра транслітерації файлу.
+
+    Асинхронне читання, транслітерація блоків у пулі потоків або процесів та асинхронний запис
+    з'єднані обмеженими чергами: пам'ять обмежена розміром черг, порядок блоків зберігається,
+    а дисковий ввід-вивід виконується паралельно з обчисленнями.
+    Якщо увімкнено маніфест, незмінений файл пропускається, а результати незмінених блоків
+    копіюються з попереднього вихідного файлу.
+    """
+
+    executors: tuple[str, ...] = ("thread", "process")
+
+    dictionary: Dictionary
+    manifest: Manifest | None
+    executor: str
+    workers: int
+    queue_size: int
+    block_lines: int
+
+    def __init__(self, dictionary: Dictionary, use_manifest: bool = False, executor: str | None = None,
+                 workers: int | None = None, queue_size: int | None = None, block_lines: int | None = None) -> None:
+        if not isinstance(dictionary, Dictionary):
+            logger.error("[FilePipeline] Помилка ініціалізації: 'dictionary' має бути екземпляром класу Dictionary")
+            raise TypeError("Параметр 'dictionary' має бути екземпляром класу Dictionary")
+        executor = executor or settings.pipeline_executor
+        if executor not in self.executors:
+            logger.error(f"[FilePipeline] Невідомий тип обробників: {executor}")
+            raise ValueError(f"Executor must be one of {self.executors}")
+
+        self.dictionary = dictionary
+        self.manifest = Manifest() if use_manifest else None
+        self.executor = executor
+        # Транслітерація на чистому Python тримає GIL, тож додаткові потоки не пришвидшують обробку
+        self.workers = workers or settings.pipeline_workers or ((os.cpu_count() or 1) if executor == "process" else 1)
+        self.queue_size = queue_size or settings.pipeline_queue_size
+        self.block_lines = block_lines or settings.files_block_lines
+        logger.debug(
+            f"[FilePipeline] Ініціалізація конвеєра: обробники {self.executor} x{self.workers}, "
+            f"розмір черг {self.queue_size}, маніфест: {use_manifest}"
+        )
+
+    def _create_executor(self) -> Executor:
+        if self.executor == "process":
+            return ProcessPoolExecutor(max_workers=self.workers, initializer=init_process_worker,
+                                       initargs=({dictionary_key(self.dictionary): self.dictionary.get_dictionary()},))
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="transliterate")
+
+    async def _reader(self, infile, queue: asyncio.Queue, stats: PipelineStats,
+                      old_blocks: dict[str, ManifestModel.EntryModel.BlockModel]) -> None:
+        started = time.perf_counter()
+        waiting = 0.0
+        async for lines in read_blocks(infile, self.block_lines):
+            block_text = ''.join(lines)
+            block_hash = Manifest.hash_text(block_text) if self.manifest is not None else ""
+            item = (lines, block_hash, len(block_text.encode("utf-8")), old_blocks.get(block_hash))
+
+            put_started = time.perf_counter()
+            await queue.put(item)
+            waiting += time.perf_counter() - put_started
+            # Позиція у файлі, а не розмір декодованого тексту, тож кінці рядків CRLF теж враховуються
+            stats.bytes_read = infile.buffer.tell()
+            stats.read_queue_max = max(stats.read_queue_max, queue.qsize())
+            stats.read_queue_total += queue.qsize()
+        stats.bytes_read = infile.buffer.tell()
+        await queue.put(None)
+        stats.reader_busy = time.perf_counter() - started - waiting
+
+    async def _transformer(self, read_queue: asyncio.Queue, write_queue: asyncio.Queue,
+                           executor: Executor, stats: PipelineStats) -> None:
+        loop = asyncio.get_running_loop()
+        # Потоки використовують сам словник, процеси — його копію, передану під час ініціалізації
+        dictionary = dictionary_key(self.dictionary) if self.executor == "process" else self.dictionary
+        while (item := await read_queue.get()) is not None:
+            lines, _, _, old_block = item
+            # Майбутні результати стають у чергу запису в порядку блоків, тож порядок зберігається
+            future = None if old_block is not None else loop.run_in_executor(executor, transliterate_lines, dictionary, lines)
+            await write_queue.put((item, future))
+            stats.write_queue_max = max(stats.write_queue_max, write_queue.qsize())
+            stats.write_queue_total += write_queue.qsize()
+        await write_queue.put(None)
+
+    async def _writer(self, queue: asyncio.Queue, outfile, oldfile, stats: PipelineStats,
+                      new_blocks: list[ManifestModel.EntryModel.BlockModel]) -> None:
+        offset = 0
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                break
+            (_, block_hash, block_size, old_block), future = entry
+
+            if future is not None:
+                processed_text, busy = await future
+                stats.transform_busy += busy
+                started = time.perf_counter()
+                # Відтворюємо перетворення кінців рядків текстового режиму
+                data = processed_text.replace("\n", os.linesep).encode("utf-8")
+                stats.recomputed_bytes += block_size
+                stats.chars_written += len(processed_text)
+            else:
+                started = time.perf_counter()
+                await oldfile.seek(old_block.output_offset)
+                data = await oldfile.read(old_block.output_length)
+                stats.reused_bytes += block_size
+            await outfile.write(data)
+            stats.writer_busy += time.perf_counter() - started
+
+            if self.manifest is not None:
+                new_blocks.append(ManifestModel.EntryModel.BlockModel(hash=block_hash, output_offset=offset, output_length=len(data)))
+            offset += len(data)
+            stats.blocks += 1
+
+    async def run(self, input_path: Path, output_path: Path, progress: ProgressCallback | None = None) -> PipelineStats:
+        """
+        Транслітерує файл input_path у output_path.
+
+        :param progress: Функція звіту про хід обробки, що викликається кожні settings.progress_interval секунд.
+
+        :return: Статистика конвеєра та повторного використання результатів.
+        """
+        started = time.perf_counter()
+        stats = PipelineStats(executor=self.executor, workers=self.workers)
+        # Хеш правил фіксується до обробки, щоб маніфест описував саме ті правила, якими створено результат
+        dictionary_hash = self.dictionary.get_content_hash()
+
+        entry: ManifestModel.EntryModel | None = None
+        input_hash: str = ""
+        if self.manifest is not None:
+            await self.manifest.load()
+            input_hash = await Manifest.hash_file(input_path)
+            entry = self.manifest.get_entry(input_path, output_path, self.dictionary)
+            if entry is not None and (not output_path.exists() or output_path.stat().st_size != entry.output_size):
+                logger.info(f"[FilePipeline] Вихідний файл {output_path} змінено або видалено, попередні результати не використовуються.")
+                entry = None
+            if entry is not None and entry.input_hash == input_hash:
+                logger.info(f"[FilePipeline] Файл {input_path} не змінився з часу попередньої обробки, обробку пропущено.")
+                stats.reused_bytes = input_path.stat().st_size
+                stats.skipped_file = True
+                stats.bytes_read = stats.reused_bytes
+                if progress is not None:
+                    progress(stats.bytes_read, stats.chars_written)
+                stats.elapsed = time.perf_counter() - started
+                return stats
+
+        old_blocks = {block.hash: block for block in entry.blocks} if entry is not None else {}
+        # Попередній результат ще читається, тому новий пишеться у тимчасовий файл
+        target_path: Path = output_path.with_name(output_path.name + ".tmp") if old_blocks else output_path
+        new_blocks: list[ManifestModel.EntryModel.BlockModel] = []
+        read_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        try:
+            with self._create_executor() as executor:
+                async with (aiofiles.open(str(input_path), mode="r", encoding="utf-8") as infile,
+                            aiofiles.open(str(target_path), mode="wb") as outfile,
+                            aiofiles.open(str(output_path), mode="rb") if old_blocks else contextlib.nullcontext() as oldfile):
+                    async with (ProgressTicker(lambda: progress(stats.bytes_read, stats.chars_written), settings.progress_interval)
+                                if progress is not None else contextlib.nullcontext()):
+                        async with asyncio.TaskGroup() as tg:
+                            tg.create_task(self._reader(infile, read_queue, stats, old_blocks))
+                            tg.create_task(self._transformer(read_queue, write_queue, executor, stats))
+                            tg.create_task(self._writer(write_queue, outfile, oldfile, stats, new_blocks))
+        except BaseException as error:
+            if target_path != output_path:
+                target_path.unlink(missing_ok=True)
+            logger.error(f"[FilePipeline] Помилка обробки файлу {input_path}: {error!r}")
+            if isinstance(error, BaseExceptionGroup):
+                # TaskGroup обгортає помилки етапів у групу; передаємо першу, щоб її обробив викликач
+                raise error.exceptions[0]
+            raise
+
+        if target_path != output_path:
+            os.replace(target_path, output_path)
+        if self.manifest is not None:
+            self.manifest.set_entry(input_path, output_path, ManifestModel.EntryModel(
+                input_hash=input_hash,
+                dictionary_hash=dictionary_hash,
+                dictionary_version=self.dictionary.get_dictionary().info.version,
+                output_size=sum(block.output_length for block in new_blocks),
+                blocks=new_blocks,
+            ))
+            await self.manifest.save()
+
+        stats.elapsed = time.perf_counter() - started
+        logger.info(
+            f"[FilePipeline] Оброблено {stats.blocks} блоків за {stats.elapsed:.3f} с; завантаженість: "
+            f"читання {stats.reader_utilisation:.0%}, транслітерація {stats.transform_utilisation:.0%}, "
+            f"запис {stats.writer_utilisation:.0%}; черги: {stats.read_queue_max}/{stats.write_queue_max}"
+        )
+        return stats
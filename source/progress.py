@@ -0,0 +1,49 @@
+"""
+Файл для періодичного звітування про хід довгих пакетних обробок.
+"""
+import asyncio
+import contextlib
+from collections.abc import Callable
+
+from source.logger import logger
+
+# Зворотний виклик отримує кількість оброблених байтів входу та кількість створених символів
+ProgressCallback = Callable[[int, int], None]
+
+
+class ProgressTicker:
+    """
+    Асинхронний менеджер контексту, що періодично викликає функцію звіту.
+
+    Обробка лише збільшує лічильники, а звіт формується за таймером, тож вартість
+    звітування не залежить від кількості рядків. Після виходу з контексту виконується
+    останній виклик з підсумковими значеннями.
+    """
+
+    callback: Callable[[], None]
+    interval: float
+    _task: asyncio.Task | None
+
+    def __init__(self, callback: Callable[[], None], interval: float) -> None:
+        if interval <= 0:
+            logger.error(f"[ProgressTicker] Інтервал звітування має бути додатним: {interval}")
+            raise ValueError("Interval must be positive")
+        self.callback = callback
+        self.interval = interval
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.callback()
+
+    async def __aenter__(self) -> "ProgressTicker":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        if exc_type is None:
+            self.callback()
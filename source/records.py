@@ -0,0 +1,258 @@
+"""
+Файл для потокової транслітерації окремих полів записів CSV та JSONL.
+"""
+import contextlib
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from functools import lru_cache
+from pathlib import Path
+
+import aiofiles
+import pydantic
+
+from source.translate import Translate
+from source.config import settings
+from source.progress import ProgressCallback, ProgressTicker
+from source.logger import logger
+
+
+class RecordsStats(pydantic.BaseModel):
+    """Модель статистики обробки записів."""
+    records: int = 0
+    fields: int = 0
+    skipped: int = 0
+    bytes_read: int = 0
+    chars_written: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+
+class RecordTransliterator:
+    """
+    Клас для транслітерації вибраних полів у записах CSV або JSONL.
+
+    Записи читаються потоково, транслітеруються лише названі поля, а решта кожного
+    запису (роздільники, лапки, пробіли, інші поля, кінці рядків) переноситься без змін.
+    Повторювані значення беруться з обмеженого кешу.
+    """
+
+    formats: tuple[str, ...] = ("csv", "jsonl")
+    delimiter: str = ","
+    read_size: int = 1 << 20
+    write_batch: int = 1024
+
+    translator: Translate
+    fields: set[str]
+    record_format: str
+    _transliterate_value: Callable[[str], str]
+
+    def __init__(self, translator: Translate, fields: list[str], record_format: str, cache_size: int = 65536) -> None:
+        if not isinstance(translator, Translate):
+            logger.error("[RecordTransliterator] Помилка ініціалізації: 'translator' має бути екземпляром класу Translate")
+            raise TypeError("Параметр 'translator' має бути екземпляром класу Translate")
+        if record_format not in self.formats:
+            logger.error(f"[RecordTransliterator] Невідомий формат записів: {record_format}")
+            raise ValueError(f"Record format must be one of {self.formats}")
+
+        self.translator = translator
+        self.fields = set(fields)
+        self.record_format = record_format
+        self._transliterate_value = lru_cache(maxsize=cache_size)(translator.transliterate)
+        logger.debug(f"[RecordTransliterator] Ініціалізація для формату {record_format}, поля: {sorted(self.fields)}, розмір кешу: {cache_size}")
+
+    @classmethod
+    def detect_format(cls, path: Path) -> str | None:
+        """Визначає формат записів за розширенням файлу."""
+        suffix = path.suffix.lower()
+        if suffix == ".csv":
+            return "csv"
+        if suffix in (".jsonl", ".ndjson"):
+            return "jsonl"
+        return None
+
+    def _split_csv_record(self, record: str) -> list[str]:
+        """Розбиває запис CSV на сирі поля, зберігаючи лапки."""
+        if '"' not in record:
+            return record.split(self.delimiter)
+
+        fields = []
+        start = 0
+        quoted = False
+        for i, char in enumerate(record):
+            if char == '"':
+                quoted = not quoted
+            elif char == self.delimiter and not quoted:
+                fields.append(record[start:i])
+                start = i + 1
+        fields.append(record[start:])
+        return fields
+
+    @staticmethod
+    def _unquote_csv_field(raw: str) -> str:
+        if raw.startswith('"') and raw.endswith('"') and len(raw) > 1:
+            return raw[1:-1].replace('""', '"')
+        return raw
+
+    def _transliterate_csv_field(self, raw: str) -> str:
+        value = self._transliterate_value(self._unquote_csv_field(raw))
+        if raw.startswith('"') or any(char in value for char in (self.delimiter, '"', "\n", "\r")):
+            return '"' + value.replace('"', '""') + '"'
+        return value
+
+    @staticmethod
+    def _split_line_ending(record: str) -> tuple[str, str]:
+        body = record.rstrip("\r\n")
+        return body, record[len(body):]
+
+    def parse_csv_header(self, record: str) -> list[int]:
+        """
+        Повертає індекси вибраних полів за заголовком CSV.
+
+        :raises KeyError: Якщо якогось поля немає в заголовку.
+        """
+        body, _ = self._split_line_ending(record)
+        # Експорт з електронних таблиць часто починається з BOM; він лишається у виводі, але не в назві поля
+        body = body.removeprefix("\ufeff")
+        names = [self._unquote_csv_field(raw) for raw in self._split_csv_record(body)]
+        missing = self.fields.difference(names)
+        if missing:
+            logger.error(f"[RecordTransliterator] Поля {sorted(missing)} відсутні в заголовку CSV")
+            raise KeyError(f"Fields not found in CSV header: {sorted(missing)}")
+        return [index for index, name in enumerate(names) if name in self.fields]
+
+    def transliterate_csv_record(self, record: str, indexes: list[int]) -> str:
+        body, line_ending = self._split_line_ending(record)
+        raw_fields = self._split_csv_record(body)
+        for index in indexes:
+            if index < len(raw_fields):
+                raw_fields[index] = self._transliterate_csv_field(raw_fields[index])
+        return self.delimiter.join(raw_fields) + line_ending
+
+    def transliterate_jsonl_record(self, record: str) -> str:
+        """
+        Транслітерує рядкові значення вибраних ключів верхнього рівня об'єкта JSON.
+
+        Замінюються лише сирі фрагменти значень, тож форматування рядка зберігається.
+        """
+        decoder = json.JSONDecoder()
+        skip = json.decoder.WHITESPACE.match
+
+        pieces = []
+        last = 0
+        i = skip(record, 0).end()
+        if i >= len(record) or record[i] != "{":
+            return record
+        i = skip(record, i + 1).end()
+        while record[i] != "}":
+            if record[i] != '"':
+                raise ValueError(f"Expected '\"' at position {i}")
+            key, i = json.decoder.scanstring(record, i + 1)
+            i = skip(record, i).end()
+            if record[i] != ":":
+                raise ValueError(f"Expected ':' at position {i}")
+            start = skip(record, i + 1).end()
+            value, end = decoder.raw_decode(record, start)
+            if key in self.fields and isinstance(value, str):
+                raw = record[start:end]
+                pieces.append(record[last:start])
+                # Екрануємо лише тоді, коли екранування було у вихідному значенні
+                pieces.append(json.dumps(self._transliterate_value(value), ensure_ascii='\\u' in raw))
+                last = end
+            i = skip(record, end).end()
+            if record[i] == ",":
+                i = skip(record, i + 1).end()
+        pieces.append(record[last:])
+        return ''.join(pieces)
+
+    async def _read_lines(self, infile, stats: RecordsStats) -> AsyncIterator[str]:
+        """Читає файл великими частинами та видає рядки разом з їхніми кінцями."""
+        pending = ""
+        while chunk := await infile.read(self.read_size):
+            stats.bytes_read += len(chunk.encode("utf-8"))
+            lines = (pending + chunk).split("\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line + "\n"
+        if pending:
+            yield pending
+
+    async def _read_records(self, infile, stats: RecordsStats) -> AsyncIterator[str]:
+        """Видає записи; для CSV рядки з незакритими лапками об'єднуються."""
+        if self.record_format != "csv":
+            async for line in self._read_lines(infile, stats):
+                yield line
+            return
+
+        parts = []
+        quotes = 0
+        async for line in self._read_lines(infile, stats):
+            parts.append(line)
+            quotes += line.count('"')
+            if quotes % 2 == 0:
+                yield ''.join(parts)
+                parts = []
+                quotes = 0
+        if parts:
+            yield ''.join(parts)
+
+    @staticmethod
+    async def _write_batch(outfile, batch: list[str], stats: RecordsStats) -> None:
+        data = ''.join(batch)
+        stats.chars_written += len(data)
+        await outfile.write(data)
+
+    async def process(self, input_path: Path, output_path: Path, progress: ProgressCallback | None = None) -> RecordsStats:
+        """
+        Потоково транслітерує записи з input_path у output_path.
+
+        :param progress: Функція звіту про хід обробки, що викликається кожні settings.progress_interval секунд.
+
+        :return: Статистика обробки.
+        """
+        stats = RecordsStats()
+        started = time.perf_counter()
+        indexes: list[int] | None = None
+        batch = []
+
+        async with (aiofiles.open(input_path, mode="r", encoding="utf-8", newline="") as infile,
+                    aiofiles.open(output_path, mode="w", encoding="utf-8", newline="") as outfile,
+                    ProgressTicker(lambda: progress(stats.bytes_read, stats.chars_written), settings.progress_interval)
+                    if progress is not None else contextlib.nullcontext()):
+            async for record in self._read_records(infile, stats):
+                if self.record_format == "csv":
+                    if indexes is None:
+                        indexes = self.parse_csv_header(record)
+                        batch.append(record)
+                        continue
+                    batch.append(self.transliterate_csv_record(record, indexes))
+                else:
+                    try:
+                        batch.append(self.transliterate_jsonl_record(record))
+                    except (ValueError, IndexError) as e:
+                        logger.warning(f"[RecordTransliterator] Запис {stats.records + 1} не є коректним об'єктом JSON, залишається без змін: {e}")
+                        batch.append(record)
+                        stats.skipped += 1
+                stats.records += 1
+
+                if len(batch) >= self.write_batch:
+                    await self._write_batch(outfile, batch, stats)
+                    batch = []
+            if batch:
+                await self._write_batch(outfile, batch, stats)
+
+        cache_info = self._transliterate_value.cache_info()
+        stats.cache_hits = cache_info.hits
+        stats.cache_misses = cache_info.misses
+        stats.fields = cache_info.hits + cache_info.misses
+        stats.elapsed = time.perf_counter() - started
+        logger.info(
+            f"[RecordTransliterator] Оброблено {stats.records} записів за {stats.elapsed:.3f} с "
+            f"({stats.records_per_second:.0f} записів/с), влучань у кеш: {stats.cache_hits}"
+        )
+        return stats
@@ -0,0 +1,236 @@
+"""
+Файл для перевірки зворотної транслітерації (round-trip) пар словників.
+"""
+import asyncio
+import bisect
+import os
+import random
+import time
+import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import aiofiles
+import pydantic
+
+from source.dictionary import Dictionary, DictionaryManager
+from source.workers import dictionary_key, init_process_worker, get_translator
+from source.logger import logger
+
+
+class RoundTripReport(pydantic.BaseModel):
+    """Модель звіту перевірки пари словників."""
+    forward: str
+    inverse: str
+    lines: int = 0
+    chars: int = 0
+    mismatches: int = 0
+    rules: dict[str, int] = {}
+    examples: list[tuple[str, str]] = []
+    worker_time: float = 0.0
+
+    @property
+    def mismatch_rate(self) -> float:
+        return self.mismatches / self.lines if self.lines else 0.0
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars / self.worker_time if self.worker_time else 0.0
+
+
+def _generate_lines(key: str, seed: int, count: int) -> list[str]:
+    """Генерує рядки зі слів, складених з ключів вхідного словника."""
+    rng = random.Random(seed)
+    keys = list(get_translator(key).get_dictionary().get_data())
+    return [
+        ' '.join(''.join(rng.choices(keys, k=rng.randint(1, 8))) for _ in range(rng.randint(1, 12)))
+        for _ in range(count)
+    ]
+
+
+def _check_batch(forward_key: str, inverse_key: str, lines: list[str] | None, seed: int, count: int,
+                 ignore_case: bool, examples_limit: int) -> dict:
+    """
+    Перевіряє пакет рядків прямим і зворотним словником.
+
+    Правилом-порушником вважається сегмент прямого словника, що містить першу розбіжність.
+    """
+    started = time.perf_counter()
+    forward = get_translator(forward_key)
+    inverse = get_translator(inverse_key)
+    if lines is None:
+        lines = _generate_lines(forward_key, seed, count)
+
+    chars = mismatches = 0
+    rules: Counter = Counter()
+    examples: list[tuple[str, str]] = []
+    for line in lines:
+        source = unicodedata.normalize('NFC', line)
+        output, offsets = forward.transliterate_with_offsets(source)
+        restored = inverse.transliterate(output)
+        chars += len(source)
+
+        expected, actual = (source.lower(), restored.lower()) if ignore_case else (source, restored)
+        if expected == actual:
+            continue
+        mismatches += 1
+        position = next((i for i, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+        source_positions = offsets[0::2]
+        segment = max(0, min(bisect.bisect_right(source_positions, position) - 1, len(source_positions) - 2))
+        rules[source[source_positions[segment]:source_positions[segment + 1]]] += 1
+        if len(examples) < examples_limit:
+            examples.append((source, restored))
+
+    return {"lines": len(lines), "chars": chars, "mismatches": mismatches, "rules": rules,
+            "examples": examples, "worker_time": time.perf_counter() - started}
+
+
+def _standards(dictionary: Dictionary) -> set[str]:
+    """
+    Повертає назви стандарту словника, отримані з id та назви файлу без сегмента напрямку.
+
+    Наприклад, для dstu9112a_cyrillic-latin і dstu9112a_latin-cyrillic це dstu9112a.
+    """
+    info = dictionary.get_dictionary().info
+    standards = set()
+    for name in (info.id, Path(info.file_name).stem):
+        # Сегмент напрямку має вигляд «письмо-письмо», наприклад cyrillic-latin або ukrkyr-ukrlat
+        segments = [segment for segment in name.split("_")
+                    if not (segment.count("-") == 1 and all(part.isalpha() for part in segment.split("-")))]
+        standards.add("_".join(segments))
+    return standards
+
+
+def discover_pairs(dm: DictionaryManager, dictionary_name: str | None = None
+                   ) -> tuple[list[tuple[Dictionary, Dictionary]], dict[str, list[str]]]:
+    """
+    Знаходить пари прямого та зворотного словників за info.from_language / info.to_language.
+
+    Якщо мовам відповідає кілька зворотних словників, вибирається той, чий стандарт (id або назва
+    файлу без напрямку) збігається з прямим. Без такого збігу пара утворюється лише з єдиним
+    кандидатом, якого не вибрав за стандартом інший словник; інакше пара вважається неоднозначною.
+
+    :param dictionary_name: Якщо вказано, повертаються лише пари з цим прямим словником.
+    :return: Пари словників і неоднозначні прямі словники разом з їхніми кандидатами.
+    """
+    dictionaries = dm.get_list_dictionaries() or {}
+    standards = {name: _standards(dictionary) for name, dictionary in dictionaries.items()}
+
+    candidates: dict[str, list[str]] = {}
+    for forward_name, forward in dictionaries.items():
+        forward_info = forward.get_dictionary().info
+        candidates[forward_name] = [
+            inverse_name for inverse_name, inverse in dictionaries.items()
+            if forward_name != inverse_name
+            and forward_info.from_language == inverse.get_dictionary().info.to_language
+            and forward_info.to_language == inverse.get_dictionary().info.from_language
+        ]
+    matched = {
+        forward_name: [name for name in names if standards[name] & standards[forward_name]]
+        for forward_name, names in candidates.items()
+    }
+    claimed = {name for names in matched.values() for name in names}
+
+    pairs = []
+    ambiguous: dict[str, list[str]] = {}
+    for forward_name, names in candidates.items():
+        if (dictionary_name and forward_name != dictionary_name) or not names:
+            continue
+        chosen = matched[forward_name] or [name for name in names if name not in claimed]
+        if len(chosen) == 1:
+            pairs.append((dictionaries[forward_name], dictionaries[chosen[0]]))
+        else:
+            logger.warning(f"[RoundTrip] Неоднозначна пара для словника {forward_name}, кандидати: {names}")
+            ambiguous[forward_name] = names
+    logger.debug(f"[RoundTrip] Знайдено {len(pairs)} пар словників, неоднозначних: {len(ambiguous)}")
+    return pairs, ambiguous
+
+
+async def _read_batches(path: Path, batch_size: int):
+    batch = []
+    async with aiofiles.open(path, mode="r", encoding="utf-8") as file:
+        async for line in file:
+            batch.append(line.rstrip("\n"))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+async def run_roundtrip(pairs: list[tuple[Dictionary, Dictionary]], corpus: Path | None = None, lines: int = 20000,
+                        batch_size: int = 500, workers: int | None = None, ignore_case: bool = False,
+                        examples_limit: int = 5) -> tuple[list[RoundTripReport], float]:
+    """
+    Паралельно перевіряє пари словників у пулі процесів.
+
+    :param corpus: Файл корпусу, що читається потоково; якщо не вказано, корпус генерується з ключів словника.
+    :param lines: Кількість згенерованих рядків на пару (якщо корпус не вказано).
+    :return: Звіти для кожної пари та загальний час виконання.
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    reports = [
+        RoundTripReport(forward=forward.get_dictionary().info.file_name, inverse=inverse.get_dictionary().info.file_name)
+        for forward, inverse in pairs
+    ]
+
+    loop = asyncio.get_running_loop()
+    # Обробники отримують правила словників з цього процесу, а не читають файли заново
+    dictionaries = {dictionary_key(dictionary): dictionary.get_dictionary() for pair in pairs for dictionary in pair}
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_process_worker, initargs=(dictionaries,)) as executor:
+        # Пакети в роботі та індекси їхніх пар
+        pending: dict[asyncio.Future, int] = {}
+
+        def submit(index: int, batch: list[str] | None, seed: int, count: int) -> None:
+            forward, inverse = pairs[index]
+            future = loop.run_in_executor(executor, _check_batch, dictionary_key(forward), dictionary_key(inverse),
+                                          batch, seed, count, ignore_case, examples_limit)
+            pending[future] = index
+
+        async def collect(limit: int) -> None:
+            """Чекає, доки в роботі залишиться менше limit пакетів, і додає результати до звітів."""
+            while len(pending) >= max(limit, 1):
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        logger.error(f"[RoundTrip] Помилка перевірки пари {reports[index].forward} → {reports[index].inverse}: {error!r}")
+                        for other in pending:
+                            other.cancel()
+                        raise
+                    _merge(reports[index], result, examples_limit)
+
+        async def throttle() -> None:
+            # Обмежуємо кількість пакетів у роботі, щоб пам'ять не залежала від розміру корпусу
+            await collect(workers * 2)
+
+        if corpus is not None:
+            async for batch in _read_batches(corpus, batch_size):
+                for index in range(len(pairs)):
+                    await throttle()
+                    submit(index, batch, 0, len(batch))
+        else:
+            for index in range(len(pairs)):
+                for seed in range(0, lines, batch_size):
+                    await throttle()
+                    submit(index, None, seed, min(batch_size, lines - seed))
+        await collect(0)
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"[RoundTrip] Перевірено {len(pairs)} пар за {elapsed:.3f} с")
+    return reports, elapsed
+
+
+def _merge(report: RoundTripReport, result: dict, examples_limit: int) -> None:
+    report.lines += result["lines"]
+    report.chars += result["chars"]
+    report.mismatches += result["mismatches"]
+    report.worker_time += result["worker_time"]
+    rules = Counter(report.rules)
+    rules.update(result["rules"])
+    report.rules = dict(rules.most_common())
+    report.examples = (report.examples + result["examples"])[:examples_limit]
@@ -2,7 +2,11 @@
 Клас для транслітерування тексту за словником.
 Версія з покращеною нормалізацією Unicode та інтелектуальною обробкою регістру.
 """
+import bisect
 import unicodedata
+from array import array
+from collections.abc import Iterable, Iterator
+
 from source.dictionary import Dictionary
 from source.logger import logger
 
@@ -15,7 +19,12 @@ class Translate:
     dictionary: Dictionary
     text: str
     _normalized_data: dict
-    _sorted_keys: list
+    _key_tables: dict[int, dict[str, str]]
+    _key_candidates: dict[tuple[int, str], list[str]]
+    _key_lengths: list[int]
+    _max_key_length: int
+    _alias_keys: set[str]
+    _dictionary_version: int
 
     def __init__(self, dictionary: Dictionary, text: str | None = None) -> None:
         if not isinstance(dictionary, Dictionary):
@@ -45,18 +54,120 @@ class Translate:
             raise TypeError("Параметр 'dictionary' має бути екземпляром класу Dictionary")
 
         self.dictionary = new_dictionary
+        self._compile()
 
+    def _compile(self) -> None:
+        """Повністю будує структуру пошуку з даних словника."""
         # Нормалізуємо дані словника ОДИН раз при його встановленні
         self._normalized_data = {
             unicodedata.normalize('NFC', k): v
             for k, v in self.dictionary.dictionary.data.items()
         }
+        # NFC-ключі, які мають ненормалізовані сирі ключі-синоніми: їхні зміни не можна відтворити інкрементально
+        self._alias_keys = {
+            unicodedata.normalize('NFC', k) for k in self.dictionary.dictionary.data
+            if not unicodedata.is_normalized('NFC', k)
+        }
 
-        # Сортуємо ключі також ОДИН раз
-        self._sorted_keys = sorted(self._normalized_data.keys(), key=len, reverse=True)
+        # Таблиці пошуку за довжиною ключа: нижній регістр -> перший ключ у порядку словника.
+        # Усі ключі з однаковими довжиною та нижнім регістром зберігаються як кандидати
+        # для інкрементального видалення.
+        self._key_tables = {}
+        self._key_candidates = {}
+        for key in self._normalized_data:
+            self._add_key(key)
+        self._update_key_lengths()
+        self._dictionary_version = self.dictionary.get_version()
 
         logger.info(f"[Translate] Оновлено, нормалізовано та відсортовано ключі для словника з {len(self._normalized_data)} елементів")
 
+    def _add_key(self, key: str) -> None:
+        lowered = key.lower()
+        self._key_candidates.setdefault((len(key), lowered), []).append(key)
+        self._key_tables.setdefault(len(key), {}).setdefault(lowered, key)
+
+    def _remove_key(self, key: str) -> None:
+        key_len, lowered = len(key), key.lower()
+        candidates = self._key_candidates[(key_len, lowered)]
+        candidates.remove(key)
+        if candidates:
+            self._key_tables[key_len][lowered] = candidates[0]
+            return
+        del self._key_candidates[(key_len, lowered)]
+        del self._key_tables[key_len][lowered]
+        if not self._key_tables[key_len]:
+            del self._key_tables[key_len]
+            self._update_key_lengths()
+
+    def _update_key_lengths(self) -> None:
+        self._key_lengths = sorted(self._key_tables, reverse=True)
+        self._max_key_length = self._key_lengths[0] if self._key_lengths else 1
+
+    def _sync_dictionary(self) -> bool:
+        """
+        Підтягує зміни словника, внесені після останньої синхронізації.
+
+        Окремі правила вставляються та видаляються за O(довжина ключа); якщо журнал змін
+        словника вже не покриває поточну версію, структура будується заново.
+        Так само вона будується заново, якщо змінено ключ не в NFC або ключ, який має синоніми
+        не в NFC: кілька сирих ключів тоді зводяться до одного правила, і його значення та
+        позиція залежать від порядку всіх синонімів у словнику.
+
+        :return: Чи змінилася структура пошуку.
+        """
+        version = self.dictionary.get_version()
+        if version == self._dictionary_version:
+            return False
+
+        changes = self.dictionary.get_changes(self._dictionary_version)
+        if changes is None or any(
+            key in self._alias_keys or not unicodedata.is_normalized('NFC', key) for key, _ in changes
+        ):
+            self._compile()
+            return True
+
+        for key, value in changes:
+            if value is None:
+                if key in self._normalized_data:
+                    del self._normalized_data[key]
+                    self._remove_key(key)
+            elif key in self._normalized_data:
+                self._normalized_data[key] = value
+            else:
+                self._normalized_data[key] = value
+                self._add_key(key)
+                if len(key) not in self._key_lengths:
+                    self._update_key_lengths()
+        self._dictionary_version = version
+        logger.info(f"[Translate] Інкрементально застосовано {len(changes)} змін словника, версія {version}")
+        return True
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Повертає NFC-форму тексту.
+
+        Текст ASCII повертається без перевірок. Для іншого тексту unicodedata.normalize сам
+        повертає той самий об'єкт, якщо швидка перевірка NFC підтверджує нормалізованість,
+        тож окремий виклик is_normalized лише додав би ще один прохід.
+        """
+        if text.isascii():
+            return text
+        return unicodedata.normalize('NFC', text)
+
+    @staticmethod
+    def _last_starter(text: str) -> int:
+        """
+        Повертає позицію останнього символу, що не є комбінованим (або 0).
+
+        Наступна частина потоку може додати до нього діакритики, тож з нього починається
+        хвіст, який ще може змінитися під час нормалізації.
+        """
+        i = len(text) - 1
+        while i > 0 and unicodedata.combining(text[i]):
+            i -= 1
+        return max(i, 0)
+
     # Окрема функція для обробки регістру
     def _get_replacement_with_case(self, source_segment: str, replacement: str) -> str:
         """Аналізує регістр вхідного сегмента та застосовує його до заміни."""
@@ -67,6 +178,60 @@ class Translate:
         # Для односимвольних або повністю нижнього регістру заміна залишається як є
         return replacement
 
+    def _match(self, text: str, position: int) -> tuple[int, str]:
+        """
+        Шукає найдовше правило словника, що збігається з текстом на позиції position.
+
+        :return: Довжина спожитого сегмента та його заміна (з урахуванням регістру).
+        """
+        for key_len in self._key_lengths:
+            source_segment = text[position:position + key_len]
+
+            # Порівнюємо у нижньому регістрі для гнучкості
+            key = self._key_tables[key_len].get(source_segment.lower())
+            if key is not None:
+                #Використовуємо функцію для визначення регістру
+                base_replacement = self._normalized_data[key]
+                replacement = self._get_replacement_with_case(source_segment, base_replacement)
+
+                logger.info(
+                    f"[Translate] Заміна: '{source_segment}' -> '{replacement}' (правило: '{key}' -> '{base_replacement}')"
+                )
+                return key_len, replacement
+
+        char_to_append = text[position]
+        logger.warning(
+            f"[Translate] Символ '{char_to_append}' на позиції {position} не знайдено у словнику. Залишається без змін."
+        )
+        return 1, char_to_append
+
+    def _transliterate_range(self, text: str, start: int, stop: int, offsets: array | None = None) -> tuple[str, int]:
+        """
+        Транслітує сегменти тексту, що починаються на позиціях з [start, stop).
+
+        :param offsets: Якщо передано, для кожного сегмента до нього додаються
+            позиція у тексті та позиція у результаті цього виклику.
+        :return: Результат та позиція, на якій завершився останній сегмент.
+        """
+        result = []
+        i = start
+        if offsets is None:
+            while i < stop:
+                key_len, replacement = self._match(text, i)
+                result.append(replacement)
+                i += key_len
+            return ''.join(result), i
+
+        output_position = 0
+        while i < stop:
+            key_len, replacement = self._match(text, i)
+            offsets.append(i)
+            offsets.append(output_position)
+            result.append(replacement)
+            i += key_len
+            output_position += len(replacement)
+        return ''.join(result), i
+
     def transliterate(self, text: str | None = None) -> str:
         """
         Ітеративно транслітує текст, використовуючи нормалізований словник
@@ -74,42 +239,364 @@ class Translate:
         """
         if text is not None:
             self.set_text(text)
+        self._sync_dictionary()
 
-        normalized_input_text = unicodedata.normalize('NFC', self.text)
+        normalized_input_text = self.normalize(self.text)
         logger.debug(f"[Translate] Початок транслітерації нормалізованого тексту: {normalized_input_text}")
 
-        result = []
-        i = 0
-        text_len = len(normalized_input_text)
+        final_text, _ = self._transliterate_range(normalized_input_text, 0, len(normalized_input_text))
+        logger.debug(f"[Translate] Результат транслітерації: '{final_text}'")
+        return final_text
+
+    def transliterate_with_offsets(self, text: str | None = None) -> tuple[str, array]:
+        """
+        Транслітує текст і повертає разом з результатом компактну карту зміщень.
+
+        Карта — плаский масив array('I') з парами (початок у вхідному тексті, початок у результаті)
+        для кожного сегмента, завершений парою (довжина вхідного тексту, довжина результату).
+        Позиції вхідного тексту відносяться до його NFC-нормалізованої форми.
+        """
+        if text is not None:
+            self.set_text(text)
+        self._sync_dictionary()
+
+        normalized_input_text = self.normalize(self.text)
+        offsets = array('I')
+        final_text, position = self._transliterate_range(normalized_input_text, 0, len(normalized_input_text), offsets)
+        offsets.append(position)
+        offsets.append(len(final_text))
+        logger.debug(f"[Translate] Результат транслітерації з картою зміщень з {len(offsets) // 2 - 1} сегментів: '{final_text}'")
+        return final_text, offsets
+
+    def transliterate_iter(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Потоково транслітує текст, що надходить частинами.
+
+        Результат видається одразу, як тільки він остаточний. Утримується лише хвіст,
+        коротший за найдовший ключ словника, бо від нього ще може залежати збіг,
+        разом з останньою комбінованою послідовністю, щоб межа частин не розрізала
+        літеру та її діакритику.
+
+        :param chunks: Ітерабельний об'єкт з частинами вхідного тексту.
+        :return: Генератор частин результату транслітерації.
+        """
+        self._sync_dictionary()
+        pending = ""
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                logger.error("[Translate] Помилка потокової транслітерації: частина тексту має бути рядком")
+                raise TypeError("Chunk must be a string")
+            if not chunk:
+                continue
+
+            buffer = self.normalize(pending + chunk)
+            # Сегменти, що починаються до stop, вже мають увесь потрібний контекст
+            # і не зачіпають останню комбіновану послідовність, яку може продовжити наступна частина
+            stop = self._last_starter(buffer) - self._max_key_length + 1
+            result, position = self._transliterate_range(buffer, 0, stop)
+            pending = buffer[position:]
+            if result:
+                yield result
+
+        if pending:
+            result, _ = self._transliterate_range(pending, 0, len(pending))
+            yield result
+
+
+class _FenwickTree:
+    """Дерево Фенвіка над довжинами блоків: зміна довжини, префіксна сума та пошук за O(log n)."""
+
+    _tree: list[int]
+
+    def __init__(self, values: Iterable[int]) -> None:
+        self._tree = [0, *values]
+        size = len(self._tree) - 1
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                self._tree[parent] += self._tree[index]
+
+    def add(self, index: int, delta: int) -> None:
+        """Додає delta до значення з індексом index."""
+        index += 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def prefix(self, count: int) -> int:
+        """Сума перших count значень."""
+        total = 0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
 
+    def search(self, value: int) -> int:
+        """Найбільша кількість перших значень, сума яких не перевищує value."""
+        count = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            if count + step < len(self._tree) and self._tree[count + step] <= value:
+                count += step
+                value -= self._tree[count]
+            step >>= 1
+        return count
+
+
+class TransliterationSession:
+    """
+    Клас для інкрементальної транслітерації тексту, що редагується.
+
+    Текст зберігається блоками, межі яких збігаються з межами сегментів. Після редагування
+    повторно транслітерується лише вікно блоків навколо зміни, розширене на довжину
+    найдовшого ключа словника в обидва боки, тож затримка не залежить від розміру документа.
+    Позиції редагувань відносяться до тексту сесії (get_source()), який зберігається в NFC.
+    Довжини блоків зберігаються у деревах Фенвіка, тож пошук блоку й оновлення зсувів після
+    редагування коштують O(log n) від кількості блоків. Вікно за можливості розбивається на ту саму
+    кількість блоків, а дерева перебудовуються, лише коли кількість блоків змінюється.
+    """
+
+    translator: Translate
+    block_size: int
+    _sources: list[str]
+    _outputs: list[str]
+    _source_lengths: _FenwickTree
+    _output_lengths: _FenwickTree
+    _source_length: int
+
+    def __init__(self, translator: Translate, text: str = "", block_size: int = 1024) -> None:
+        if not isinstance(translator, Translate):
+            logger.error("[TransliterationSession] Помилка ініціалізації: 'translator' має бути екземпляром класу Translate")
+            raise TypeError("Параметр 'translator' має бути екземпляром класу Translate")
+        if not isinstance(text, str):
+            logger.error("[TransliterationSession] Помилка ініціалізації: 'text' має бути рядком")
+            raise TypeError("Параметр 'text' має бути рядком")
+        if block_size < 1:
+            logger.error("[TransliterationSession] Помилка ініціалізації: 'block_size' має бути додатним")
+            raise ValueError("Параметр 'block_size' має бути додатним")
+
+        self.translator = translator
+        self.block_size = block_size
+
+        translator._sync_dictionary()
+        source = Translate.normalize(text)
+        offsets = array('I')
+        output, _ = translator._transliterate_range(source, 0, len(source), offsets)
+        self._sources, self._outputs = self._split_blocks(source, output, offsets)
+        self._rebuild_lengths()
+        self._source_length = len(source)
+        logger.debug(f"[TransliterationSession] Створено сесію з {len(self._sources)} блоків для тексту довжиною {self._source_length}")
+
+    def _split_blocks(self, source: str, output: str, offsets: array,
+                      count: int | None = None) -> tuple[list[str], list[str]]:
+        """
+        Розбиває текст і результат на блоки приблизно block_size символів за межами сегментів.
+
+        :param count: Якщо задано, текст розбивається рівно на count блоків приблизно однакової довжини
+            (деякі з них можуть бути порожніми).
+        """
+        source_positions = offsets[0::2]
+        output_positions = offsets[1::2]
+        source_positions.append(len(source))
+        output_positions.append(len(output))
+
+        if count is not None:
+            cuts = [0, *(bisect.bisect_left(source_positions, len(source) * part // count) for part in range(1, count)),
+                     len(source_positions) - 1]
+            return ([source[source_positions[a]:source_positions[b]] for a, b in zip(cuts, cuts[1:])],
+                    [output[output_positions[a]:output_positions[b]] for a, b in zip(cuts, cuts[1:])])
+
+        sources, outputs = [], []
+        start = 0
+        while source_positions[start] < len(source):
+            end = bisect.bisect_left(source_positions, source_positions[start] + self.block_size)
+            end = min(end, len(source_positions) - 1)
+            sources.append(source[source_positions[start]:source_positions[end]])
+            outputs.append(output[output_positions[start]:output_positions[end]])
+            start = end
+        if not sources:
+            sources.append("")
+            outputs.append("")
+        return sources, outputs
+
+    def _rebuild_lengths(self) -> None:
+        self._source_lengths = _FenwickTree(map(len, self._sources))
+        self._output_lengths = _FenwickTree(map(len, self._outputs))
+
+    def _find_block(self, position: int) -> tuple[int, int, int]:
+        """
+        Шукає блок, що містить позицію вхідного тексту.
+
+        :return: Індекс блоку, його початок у вхідному тексті та початок у результаті.
+        """
+        index = min(self._source_lengths.search(position), len(self._sources) - 1)
+        return index, self._source_lengths.prefix(index), self._output_lengths.prefix(index)
+
+    def _starts_with_combining(self, index: int) -> bool:
+        """Чи починається блок з комбінованого символу, який нормалізація може приєднати до попереднього блоку."""
+        return index < len(self._sources) and bool(self._sources[index]) and unicodedata.combining(self._sources[index][0]) != 0
+
+    def get_source(self) -> str:
+        return ''.join(self._sources)
+
+    def get_output(self) -> str:
+        return ''.join(self._outputs)
+
+    def edit(self, offset: int, deleted: int, inserted: str = "") -> tuple[int, int, str]:
+        """
+        Застосовує редагування вхідного тексту та оновлює результат.
+
+        :param offset: Позиція редагування у вхідному тексті.
+        :param deleted: Кількість видалених символів, починаючи з offset.
+        :param inserted: Вставлений текст.
+        :return: Латка для результату: позиція, кількість видалених символів і вставлений текст.
+        """
+        if not isinstance(inserted, str):
+            logger.error("[TransliterationSession] Помилка редагування: 'inserted' має бути рядком")
+            raise TypeError("Параметр 'inserted' має бути рядком")
+        if offset < 0 or deleted < 0 or offset + deleted > self._source_length:
+            logger.error(f"[TransliterationSession] Помилка редагування: зміна ({offset}, {deleted}) виходить за межі тексту довжиною {self._source_length}")
+            raise ValueError("Редагування виходить за межі тексту")
+
+        self.translator._sync_dictionary()
+        max_key_length = self.translator._max_key_length
+
+        # Сегменти, що починаються раніше ніж за max_key_length до зміни, її не бачать
+        first, source_start, output_start = self._find_block(max(0, offset - max_key_length))
+        last = max(first, self._find_block(offset + deleted + max_key_length)[0])
+        # Вікно нормалізується разом зі вставкою, тож його межі не можуть розрізати комбіновану послідовність
+        while first > 0 and self._starts_with_combining(first):
+            first -= 1
+        source_start, output_start = self._source_lengths.prefix(first), self._output_lengths.prefix(first)
+
+        while True:
+            while self._starts_with_combining(last + 1):
+                last += 1
+            window = ''.join(self._sources[first:last + 1])
+            local = Translate.normalize(window[:offset - source_start] + inserted + window[offset + deleted - source_start:])
+            lookahead = self._sources[last + 1][:max_key_length] if last + 1 < len(self._sources) else ""
+
+            offsets = array('I')
+            output, position = self.translator._transliterate_range(local + lookahead, 0, len(local), offsets)
+            # Якщо останній сегмент зайшов у наступний блок, вікно розширюється на нього
+            if position == len(local) or last + 1 >= len(self._sources):
+                break
+            last += 1
+
+        count = last - first + 1
+        old_sources, old_outputs = self._sources[first:last + 1], self._outputs[first:last + 1]
+        old_output_length = sum(map(len, old_outputs))
+        sources, outputs = self._split_blocks(local, output, offsets)
+        if local and len(sources) != count:
+            # Та сама кількість блоків дозволяє оновити дерева довжин без перебудови
+            balanced = self._split_blocks(local, output, offsets, count)
+            if all(0 < len(source) <= 2 * self.block_size for source in balanced[0]):
+                sources, outputs = balanced
+        if not local and len(self._sources) > count:
+            sources, outputs = [], []
+        self._sources[first:last + 1] = sources
+        self._outputs[first:last + 1] = outputs
+        if len(sources) == count:
+            for index, (old_source, old_output, source, output_block) in enumerate(
+                    zip(old_sources, old_outputs, sources, outputs), first):
+                self._source_lengths.add(index, len(source) - len(old_source))
+                self._output_lengths.add(index, len(output_block) - len(old_output))
+        else:
+            self._rebuild_lengths()
+        self._source_length += len(local) - sum(map(len, old_sources))
+
+        logger.debug(
+            f"[TransliterationSession] Редагування ({offset}, {deleted}, {len(inserted)}) перераховано у вікні блоків {first}-{last}"
+        )
+        return output_start, old_output_length, output
+
+
+class MultiTranslate:
+    """
+    Клас для транслітерації тексту одразу за кількома словниками за один прохід.
+
+    Поки межі сегментів усіх словників збігаються, пошук виконується один раз у спільній
+    таблиці ключів. Там, де набори ключів розходяться, кожен словник сканує текст окремо
+    лише до найближчої спільної межі сегментів.
+    """
+
+    translators: list[Translate]
+    _key_tables: dict[int, dict[str, tuple[str | None, ...]]]
+    _key_lengths: list[int]
+
+    def __init__(self, dictionaries: list[Dictionary]) -> None:
+        if not dictionaries or not all(isinstance(dictionary, Dictionary) for dictionary in dictionaries):
+            logger.error("[MultiTranslate] Помилка ініціалізації: 'dictionaries' має бути непорожнім списком екземплярів класу Dictionary")
+            raise TypeError("Параметр 'dictionaries' має бути непорожнім списком екземплярів класу Dictionary")
+
+        self.translators = [Translate(dictionary) for dictionary in dictionaries]
+        self._build_tables()
+
+    def _build_tables(self) -> None:
+        """Об'єднує таблиці ключів усіх словників: для кожного ключа — ключі кожного словника або None."""
+        self._key_tables = {}
+        for key_len in {key_len for translator in self.translators for key_len in translator._key_lengths}:
+            tables = [translator._key_tables.get(key_len, {}) for translator in self.translators]
+            self._key_tables[key_len] = {
+                lowered: tuple(table.get(lowered) for table in tables)
+                for lowered in set().union(*tables)
+            }
+        self._key_lengths = sorted(self._key_tables, reverse=True)
+        logger.info(f"[MultiTranslate] Побудовано спільну таблицю ключів для {len(self.translators)} словників")
+
+    def _match_shared(self, text: str, position: int) -> list[tuple[int, str]]:
+        """Шукає збіги для всіх словників на одній позиції за спільною таблицею."""
+        found: list[tuple[int, str] | None] = [None] * len(self.translators)
+        missing = len(self.translators)
+        for key_len in self._key_lengths:
+            source_segment = text[position:position + key_len]
+            keys = self._key_tables[key_len].get(source_segment.lower())
+            if keys is None:
+                continue
+            for index, key in enumerate(keys):
+                if key is not None and found[index] is None:
+                    translator = self.translators[index]
+                    found[index] = (key_len, translator._get_replacement_with_case(source_segment, translator._normalized_data[key]))
+                    missing -= 1
+            if not missing:
+                break
+        return [match if match is not None else (1, text[position]) for match in found]
+
+    def transliterate(self, text: str) -> list[str]:
+        """
+        Транслітує текст за всіма словниками.
+
+        :return: Результати у порядку словників.
+        """
+        if not isinstance(text, str):
+            logger.error("[MultiTranslate] Помилка транслітерації: 'text' має бути рядком")
+            raise TypeError("Параметр 'text' має бути рядком")
+
+        if any([translator._sync_dictionary() for translator in self.translators]):
+            self._build_tables()
+
+        normalized_input_text = Translate.normalize(text)
+        logger.debug(f"[MultiTranslate] Початок транслітерації за {len(self.translators)} словниками: {normalized_input_text}")
+
+        results: list[list[str]] = [[] for _ in self.translators]
+        text_len = len(normalized_input_text)
+        diverged = 0
+        i = 0
         while i < text_len:
-            matched = False
-            for key in self._sorted_keys:
-                key_len = len(key)
-                source_segment = normalized_input_text[i:i + key_len]
-
-                # Порівнюємо у нижньому регістрі для гнучкості
-                if source_segment.lower() == key.lower():
-                    #Використовуємо функцію для визначення регістру
-                    base_replacement = self._normalized_data[key]
-                    replacement = self._get_replacement_with_case(source_segment, base_replacement)
-
-                    logger.info(
-                        f"[Translate] Заміна: '{source_segment}' -> '{replacement}' (правило: '{key}' -> '{base_replacement}')"
-                    )
-                    result.append(replacement)
-                    i += key_len
-                    matched = True
-                    break
-
-            if not matched:
-                char_to_append = normalized_input_text[i]
-                logger.warning(
-                    f"[Translate] Символ '{char_to_append}' на позиції {i} не знайдено у словнику. Залишається без змін."
-                )
-                result.append(char_to_append)
-                i += 1
+            matches = self._match_shared(normalized_input_text, i)
+            for result, (_, replacement) in zip(results, matches):
+                result.append(replacement)
 
-        final_text = ''.join(result)
-        logger.debug(f"[Translate] Результат транслітерації: '{final_text}'")
-        return final_text
\ No newline at end of file
+            positions = [i + key_len for key_len, _ in matches]
+            if min(positions) != max(positions):
+                # Набори ключів розійшлися: відстаючі словники сканують окремо до спільної межі
+                diverged += 1
+                while min(positions) != max(positions):
+                    index = positions.index(min(positions))
+                    key_len, replacement = self.translators[index]._match(normalized_input_text, positions[index])
+                    results[index].append(replacement)
+                    positions[index] += key_len
+            i = positions[0]
+
+        logger.debug(f"[MultiTranslate] Транслітерацію завершено, окремих сканувань: {diverged}")
+        return [''.join(result) for result in results]
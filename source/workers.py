@@ -0,0 +1,68 @@
+"""
+Файл з функціями для обробників у пулах потоків і процесів.
+"""
+import threading
+import time
+import weakref
+
+from source.dictionary import Dictionary, DictionaryModel
+from source.translate import Translate
+from source.logger import logger
+
+# Транслятори обробника, окремі для кожного потоку, ключ — об'єкт словника
+_local = threading.local()
+# Словники процесу-обробника, передані з основного процесу, ключ — шлях до файлу словника
+_process_dictionaries: dict[str, Dictionary] = {}
+
+
+def dictionary_key(dictionary: Dictionary) -> str:
+    """Повертає ключ, за яким словник передається процесам-обробникам."""
+    return str(dictionary.get_file())
+
+
+def init_process_worker(dictionaries: dict[str, DictionaryModel] | None = None) -> None:
+    """
+    Налаштовує процес-обробник.
+
+    :param dictionaries: Дані словників з основного процесу, ключ — dictionary_key. Словники передаються
+        разом із правилами, тож обробники використовують ті самі правила, що й основний процес,
+        навіть якщо їх змінено без збереження у файл.
+    """
+    # Обробники-процеси не пишуть журнал кожної заміни, щоб не змагатися за спільні файли журналів
+    logger.remove()
+    for key, model in (dictionaries or {}).items():
+        dictionary = Dictionary(model.info.file_path)
+        dictionary.set_dictionary(model)
+        _process_dictionaries[key] = dictionary
+
+
+def get_translator(dictionary: Dictionary | str) -> Translate:
+    """
+    Повертає транслятор для словника, створюючи його один раз на потік.
+
+    Translate зберігає поточний текст у собі, тож один екземпляр не можна ділити між потоками.
+
+    :param dictionary: Словник (для потоків) або ключ словника, переданого процесу-обробнику.
+    """
+    if isinstance(dictionary, str):
+        dictionary = _process_dictionaries[dictionary]
+    translators: weakref.WeakKeyDictionary | None = getattr(_local, "translators", None)
+    if translators is None:
+        translators = _local.translators = weakref.WeakKeyDictionary()
+    translator = translators.get(dictionary)
+    if translator is None:
+        translator = translators[dictionary] = Translate(dictionary)
+    return translator
+
+
+def transliterate_lines(dictionary: Dictionary | str, lines: list[str]) -> tuple[str, float]:
+    """
+    Транслітерує рядки незалежно один від одного.
+
+    :return: Результат і процесорний час обробника в секундах. Очікування GIL сусідніми потоками
+        до нього не входить, тож сума за всіма потоками не перевищує тривалості обробки.
+    """
+    started = time.thread_time()
+    translator = get_translator(dictionary)
+    result = ''.join(translator.transliterate(line) for line in lines)
+    return result, time.thread_time() - started